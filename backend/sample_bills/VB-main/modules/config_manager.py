@@ -11,6 +11,13 @@ import logging
 from typing import Dict, Any, Optional, Union
 from pathlib import Path
 
+# Prefer the libyaml C bindings when PyYAML was built with them; they
+# parse identically to SafeLoader at a fraction of the cost
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 class ConfigurationError(Exception):
     """Custom exception for configuration-related errors."""
     pass
@@ -56,7 +63,7 @@ class ConfigManager:
                 raise ConfigurationError(f"Configuration file not found: {config_path}")
             
             with open(config_file, 'r', encoding='utf-8') as f:
-                self._config = yaml.safe_load(f) or {}
+                self._config = yaml.load(f, Loader=_YamlLoader) or {}
             
             self._config_file_path = config_path
             self._apply_environment_overrides()
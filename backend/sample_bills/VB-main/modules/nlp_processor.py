@@ -6,11 +6,16 @@ using spaCy, NLTK, and custom legal entity recognition.
 """
 
 import re
+import numpy as np
 import spacy
 import nltk
+from spacy.language import Language
+from spacy.matcher import PhraseMatcher
+from spacy.tokens import Span
+from spacy.util import filter_spans
 from typing import Dict, List, Any, Optional, Tuple, Set
 from dataclasses import dataclass
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, OrderedDict
 import logging
 
 from .config_manager import config
@@ -19,6 +24,55 @@ from .logger import get_logger, log_performance
 
 logger = get_logger(__name__)
 
+# Literal-only legal entity patterns, matched with a PhraseMatcher built once
+# at pipeline setup. Genuinely multi-attribute token patterns stay with the
+# entity_ruler in _add_legal_entity_ruler.
+LEGAL_PHRASE_PATTERNS: Dict[str, List[str]] = {
+    'COURT': [
+        'supreme court', 'district court', 'circuit court',
+        'appellate court', 'municipal court'
+    ],
+    'LEGAL_DOC': [
+        'summons', 'subpoena', 'warrant', 'citation',
+        'complaint', 'motion', 'brief', 'affidavit'
+    ],
+    'LEGAL_STATUS': [
+        'defendant', 'plaintiff', 'petitioner',
+        'respondent', 'appellant', 'appellee'
+    ],
+    'JURISDICTION': [
+        'federal', 'state', 'municipal', 'county',
+        'administrative', 'commercial'
+    ],
+}
+
+
+class LegalPhraseMatcher:
+    """Pipeline component that tags literal legal terms as entities.
+
+    Uses a PhraseMatcher compiled once from lowercased phrase docs, which is
+    substantially faster at match time than equivalent token-rule patterns.
+    """
+
+    def __init__(self, nlp):
+        self.matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+        for label, terms in LEGAL_PHRASE_PATTERNS.items():
+            self.matcher.add(label, [nlp.make_doc(term) for term in terms])
+
+    def __call__(self, doc):
+        spans = [
+            Span(doc, start, end, label=match_id)
+            for match_id, start, end in self.matcher(doc)
+        ]
+        if spans:
+            doc.ents = filter_spans(list(doc.ents) + spans)
+        return doc
+
+
+@Language.factory("legal_phrase_matcher")
+def create_legal_phrase_matcher(nlp, name):
+    return LegalPhraseMatcher(nlp)
+
 @dataclass
 class LegalEntity:
     """Represents a legal entity found in text."""
@@ -41,13 +95,24 @@ class ContradictionPair:
 
 @dataclass
 class LegalConcept:
-    """Represents a legal concept identified in text."""
+    """Represents a legal concept identified in text.
+
+    Mention offsets are stored as parallel int32 arrays (structure of
+    arrays) rather than a list of tuples; large documents can carry
+    thousands of mentions and the packed layout halves the memory cost.
+    """
     concept: str
     category: str
-    mentions: List[Tuple[int, int]]
+    starts: np.ndarray
+    ends: np.ndarray
     confidence: float
     related_terms: List[str]
 
+    @property
+    def mentions(self) -> List[Tuple[int, int]]:
+        """Mention (start, end) pairs, materialized for compatibility."""
+        return list(zip(self.starts.tolist(), self.ends.tolist()))
+
 class LegalNLPProcessor:
     """
     Enhanced NLP processor for legal document analysis.
@@ -60,16 +125,46 @@ class LegalNLPProcessor:
     - Clause extraction and classification
     """
     
+    # Maximum number of parsed Docs kept in the per-instance LRU cache
+    PARSE_CACHE_SIZE = 64
+
     def __init__(self):
         """Initialize the NLP processor."""
         self.nlp = None
         self.legal_patterns = {}
         self.legal_entities = {}
         self.contradiction_patterns = []
-        
+        self._parse_cache: "OrderedDict[str, Any]" = OrderedDict()
+
+        # Lightweight pipeline for callers that only need sentence
+        # boundaries; the rule-based sentencizer is orders of magnitude
+        # faster than a full parse and sufficient for punctuated legal prose
+        self.nlp_senter = spacy.blank("en")
+        self.nlp_senter.add_pipe("sentencizer")
+
         self._initialize_nlp()
         self._load_legal_patterns()
         self._load_contradiction_patterns()
+
+    def _parse(self, text: str):
+        """Run the spaCy pipeline with a small LRU cache.
+
+        Callers commonly run several analyses (entities, contradictions,
+        clauses, sentiment) over the same document; caching the parsed Doc
+        means the pipeline runs once per document instead of once per
+        analysis.
+        """
+        cache = self._parse_cache
+        doc = cache.get(text)
+        if doc is not None:
+            cache.move_to_end(text)
+            return doc
+
+        doc = self.nlp(text)
+        cache[text] = doc
+        if len(cache) > self.PARSE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return doc
     
     def _initialize_nlp(self) -> None:
         """Initialize spaCy NLP pipeline."""
@@ -95,56 +190,30 @@ class LegalNLPProcessor:
     
     def _add_legal_entity_ruler(self) -> None:
         """Add custom legal entity recognition patterns."""
+        # Literal single/multi-word terms go through the PhraseMatcher
+        # component, which is built once and avoids per-call trie rebuilds.
+        if "legal_phrase_matcher" not in self.nlp.pipe_names:
+            self.nlp.add_pipe("legal_phrase_matcher", before="ner")
+
         if "entity_ruler" not in self.nlp.pipe_names:
             ruler = self.nlp.add_pipe("entity_ruler", before="ner")
         else:
             ruler = self.nlp.get_pipe("entity_ruler")
-        
-        # Legal entity patterns
+
+        # Token-rule patterns reserved for anything that needs more than a
+        # literal lowercase match
         legal_patterns = [
-            # Court types
-            {"label": "COURT", "pattern": [{"LOWER": "supreme"}, {"LOWER": "court"}]},
-            {"label": "COURT", "pattern": [{"LOWER": "district"}, {"LOWER": "court"}]},
-            {"label": "COURT", "pattern": [{"LOWER": "circuit"}, {"LOWER": "court"}]},
-            {"label": "COURT", "pattern": [{"LOWER": "appellate"}, {"LOWER": "court"}]},
-            {"label": "COURT", "pattern": [{"LOWER": "municipal"}, {"LOWER": "court"}]},
-            
-            # Legal documents
-            {"label": "LEGAL_DOC", "pattern": [{"LOWER": "summons"}]},
-            {"label": "LEGAL_DOC", "pattern": [{"LOWER": "subpoena"}]},
-            {"label": "LEGAL_DOC", "pattern": [{"LOWER": "warrant"}]},
-            {"label": "LEGAL_DOC", "pattern": [{"LOWER": "citation"}]},
-            {"label": "LEGAL_DOC", "pattern": [{"LOWER": "complaint"}]},
-            {"label": "LEGAL_DOC", "pattern": [{"LOWER": "motion"}]},
-            {"label": "LEGAL_DOC", "pattern": [{"LOWER": "brief"}]},
-            {"label": "LEGAL_DOC", "pattern": [{"LOWER": "affidavit"}]},
-            
-            # Legal statuses
-            {"label": "LEGAL_STATUS", "pattern": [{"LOWER": "defendant"}]},
-            {"label": "LEGAL_STATUS", "pattern": [{"LOWER": "plaintiff"}]},
-            {"label": "LEGAL_STATUS", "pattern": [{"LOWER": "petitioner"}]},
-            {"label": "LEGAL_STATUS", "pattern": [{"LOWER": "respondent"}]},
-            {"label": "LEGAL_STATUS", "pattern": [{"LOWER": "appellant"}]},
-            {"label": "LEGAL_STATUS", "pattern": [{"LOWER": "appellee"}]},
-            
             # Legal concepts
             {"label": "LEGAL_CONCEPT", "pattern": [{"LOWER": "jurisdiction"}]},
             {"label": "LEGAL_CONCEPT", "pattern": [{"LOWER": "due"}, {"LOWER": "process"}]},
             {"label": "LEGAL_CONCEPT", "pattern": [{"LOWER": "constitutional"}, {"LOWER": "rights"}]},
             {"label": "LEGAL_CONCEPT", "pattern": [{"LOWER": "probable"}, {"LOWER": "cause"}]},
             {"label": "LEGAL_CONCEPT", "pattern": [{"LOWER": "reasonable"}, {"LOWER": "suspicion"}]},
-            
-            # Jurisdictional terms
-            {"label": "JURISDICTION", "pattern": [{"LOWER": "federal"}]},
-            {"label": "JURISDICTION", "pattern": [{"LOWER": "state"}]},
-            {"label": "JURISDICTION", "pattern": [{"LOWER": "municipal"}]},
-            {"label": "JURISDICTION", "pattern": [{"LOWER": "county"}]},
-            {"label": "JURISDICTION", "pattern": [{"LOWER": "administrative"}]},
-            {"label": "JURISDICTION", "pattern": [{"LOWER": "commercial"}]},
         ]
-        
+
         ruler.add_patterns(legal_patterns)
-        logger.debug(f"Added {len(legal_patterns)} legal entity patterns")
+        phrase_count = sum(len(terms) for terms in LEGAL_PHRASE_PATTERNS.values())
+        logger.debug(f"Added {phrase_count} phrase patterns and {len(legal_patterns)} rule patterns")
     
     def _load_legal_patterns(self) -> None:
         """Load legal concept patterns for analysis."""
@@ -175,10 +244,34 @@ class LegalNLPProcessor:
                 r'\b(?:jurisdiction|venue|forum|authority)\b'
             ]
         }
+
+        # Fuse every category into one alternation with named groups so
+        # identify_legal_concepts scans the text a single time instead of
+        # once per pattern. Matched against lowercased text, so the fused
+        # regex compiles case-sensitive.
+        self._concept_scanner = re.compile('|'.join(
+            f"(?P<{category}>{'|'.join(patterns)})"
+            for category, patterns in self.legal_patterns.items()
+        ))
+
+        # The fused scan only names the first category that matches, but
+        # some terms belong to several (e.g. "authority" is both a
+        # rights_and_powers and a jurisdictional term). Per-category
+        # alternations let identify_legal_concepts re-check each matched
+        # token against the remaining categories.
+        self._category_scanners = tuple(
+            (category, re.compile('|'.join(patterns)))
+            for category, patterns in self.legal_patterns.items()
+        )
     
     def _load_contradiction_patterns(self) -> None:
-        """Load patterns for detecting contradictions."""
-        self.contradiction_patterns = [
+        """Load patterns for detecting contradictions.
+
+        Patterns are compiled case-sensitive and matched against
+        lowercased sentences; lowercasing each sentence once is cheaper
+        than case-folded matching inside the O(N^2) pair loop.
+        """
+        contradiction_patterns = [
             # Direct negation patterns
             (r'\b(shall|must|will|required?)\b', r'\b(shall not|must not|will not|not required|prohibited|forbidden)\b'),
             (r'\b(mandatory|compulsory|obligatory)\b', r'\b(optional|voluntary|discretionary)\b'),
@@ -195,6 +288,10 @@ class LegalNLPProcessor:
             (r'\b(maximum|at most|no more than)\b', r'\b(minimum|at least|no less than)\b'),
             (r'\b(increase|raise|elevate)\b', r'\b(decrease|lower|reduce)\b'),
         ]
+        self.contradiction_patterns = [
+            (re.compile(pattern1), re.compile(pattern2))
+            for pattern1, pattern2 in contradiction_patterns
+        ]
     
     @log_performance("legal_entity_extraction")
     def extract_legal_entities(self, text: str) -> List[LegalEntity]:
@@ -211,14 +308,16 @@ class LegalNLPProcessor:
             raise AnalysisError("NLP processor not initialized")
         
         try:
-            doc = self.nlp(text)
+            doc = self._parse(text)
             entities = []
             
+            text = doc.text
             for ent in doc.ents:
-                # Get context around the entity
-                start_idx = max(0, ent.start - 5)
-                end_idx = min(len(doc), ent.end + 5)
-                context = doc[start_idx:end_idx].text
+                # Get context around the entity via raw character offsets;
+                # slicing doc[...] would build a throwaway Span per entity
+                start_tok = doc[max(0, ent.start - 5)]
+                end_tok = doc[min(len(doc) - 1, ent.end + 4)]
+                context = text[start_tok.idx:end_tok.idx + len(end_tok)]
                 
                 entity = LegalEntity(
                     text=ent.text,
@@ -250,12 +349,18 @@ class LegalNLPProcessor:
         """
         contradictions = []
         sentences = self._split_into_sentences(text)
-        
+
         try:
+            # Lowercase each sentence once; the pair loop then runs
+            # case-sensitive matches on the lowered strings
+            sents_lower = [sent.lower() for sent in sentences]
+
             # Check for pattern-based contradictions
             for i, sent1 in enumerate(sentences):
                 for j, sent2 in enumerate(sentences[i+1:], i+1):
-                    contradiction = self._check_sentence_contradiction(sent1, sent2, text)
+                    contradiction = self._check_sentence_contradiction(
+                        sent1, sent2, sents_lower[i], sents_lower[j], text
+                    )
                     if contradiction:
                         contradictions.append(contradiction)
             
@@ -271,22 +376,32 @@ class LegalNLPProcessor:
             logger.error(f"Error detecting contradictions: {e}")
             raise AnalysisError(f"Contradiction detection failed: {e}") from e
     
-    def _split_into_sentences(self, text: str) -> List[str]:
-        """Split text into sentences."""
-        if self.nlp:
-            doc = self.nlp(text)
+    def _split_into_sentences(self, text: str, use_parser: bool = False) -> List[str]:
+        """Split text into sentences.
+
+        Uses the rule-based sentencizer pipeline by default; pass
+        ``use_parser=True`` for parser-quality boundaries on text with
+        ambiguous formatting.
+        """
+        if use_parser and self.nlp:
+            doc = self._parse(text)
+            return [sent.text.strip() for sent in doc.sents if sent.text.strip()]
+        elif self.nlp_senter:
+            doc = self.nlp_senter(text)
             return [sent.text.strip() for sent in doc.sents if sent.text.strip()]
         else:
             # Fallback to simple sentence splitting
             sentences = re.split(r'[.!?]+', text)
             return [s.strip() for s in sentences if s.strip()]
     
-    def _check_sentence_contradiction(self, sent1: str, sent2: str, full_text: str) -> Optional[ContradictionPair]:
+    def _check_sentence_contradiction(self, sent1: str, sent2: str,
+                                      sent1_lower: str, sent2_lower: str,
+                                      full_text: str) -> Optional[ContradictionPair]:
         """Check if two sentences contradict each other."""
         for pattern1, pattern2 in self.contradiction_patterns:
-            match1 = re.search(pattern1, sent1, re.IGNORECASE)
-            match2 = re.search(pattern2, sent2, re.IGNORECASE)
-            
+            match1 = pattern1.search(sent1_lower)
+            match2 = pattern2.search(sent2_lower)
+
             if match1 and match2:
                 # Calculate positions in full text
                 pos1 = full_text.find(sent1)
@@ -314,33 +429,42 @@ class LegalNLPProcessor:
         if not self.nlp or not self.nlp.has_pipe('tok2vec'):
             return contradictions
         
+        if len(sentences) < 2:
+            return contradictions
+
         try:
-            # Process sentences with spaCy
-            docs = [self.nlp(sent) for sent in sentences]
-            
+            # Process sentences with spaCy (cached across repeat analyses)
+            docs = [self._parse(sent) for sent in sentences]
+
+            # Build one (N, D) matrix of normalized sentence vectors so all
+            # pairwise similarities come out of a single matrix product
+            # instead of O(N^2) doc.similarity calls
+            vectors = np.stack([doc.vector for doc in docs]).astype(np.float32)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors /= norms + 1e-9
+            similarity_matrix = vectors @ vectors.T
+
+            # Only the upper triangle holds distinct (i, j) pairs
+            candidates = np.argwhere(np.triu(similarity_matrix, k=1) > 0.7)
+
             # Look for sentences with high similarity but opposite sentiment
-            for i, doc1 in enumerate(docs):
-                for j, doc2 in enumerate(docs[i+1:], i+1):
-                    similarity = doc1.similarity(doc2)
-                    
-                    # High similarity but potential contradiction
-                    if similarity > 0.7:
-                        # Check for negation patterns
-                        if self._has_negation_difference(doc1, doc2):
-                            pos1 = full_text.find(sentences[i])
-                            pos2 = full_text.find(sentences[j])
-                            
-                            if pos1 != -1 and pos2 != -1:
-                                contradiction = ContradictionPair(
-                                    statement1=sentences[i],
-                                    statement2=sentences[j],
-                                    confidence=similarity * 0.6,  # Lower confidence for semantic
-                                    explanation="Semantic contradiction detected through similarity analysis",
-                                    location1=(pos1, pos1 + len(sentences[i])),
-                                    location2=(pos2, pos2 + len(sentences[j]))
-                                )
-                                contradictions.append(contradiction)
-            
+            for i, j in candidates:
+                # Check for negation patterns
+                if self._has_negation_difference(docs[i], docs[j]):
+                    pos1 = full_text.find(sentences[i])
+                    pos2 = full_text.find(sentences[j])
+
+                    if pos1 != -1 and pos2 != -1:
+                        contradiction = ContradictionPair(
+                            statement1=sentences[i],
+                            statement2=sentences[j],
+                            confidence=float(similarity_matrix[i, j]) * 0.6,  # Lower confidence for semantic
+                            explanation="Semantic contradiction detected through similarity analysis",
+                            location1=(pos1, pos1 + len(sentences[i])),
+                            location2=(pos2, pos2 + len(sentences[j]))
+                        )
+                        contradictions.append(contradiction)
+
         except Exception as e:
             logger.warning(f"Semantic contradiction detection failed: {e}")
         
@@ -367,24 +491,37 @@ class LegalNLPProcessor:
             List of legal concepts found
         """
         concepts = []
-        
+
         try:
-            for category, patterns in self.legal_patterns.items():
-                concept_mentions = defaultdict(list)
-                
-                for pattern in patterns:
-                    matches = re.finditer(pattern, text, re.IGNORECASE)
-                    for match in matches:
-                        concept_text = match.group().lower()
-                        concept_mentions[concept_text].append((match.start(), match.end()))
-                
+            # Single pass with the fused scanner; match.lastgroup names the
+            # first category whose alternative matched. Each distinct token
+            # is then re-checked once against the per-category scanners so
+            # terms listed under several categories credit all of them,
+            # with the token -> categories resolution memoized across hits.
+            concept_mentions = defaultdict(lambda: defaultdict(list))
+            token_categories = {}
+            for match in self._concept_scanner.finditer(text.lower()):
+                token = match.group()
+                categories = token_categories.get(token)
+                if categories is None:
+                    categories = token_categories[token] = tuple(
+                        category for category, scanner in self._category_scanners
+                        if scanner.fullmatch(token)
+                    ) or (match.lastgroup,)
+                span = match.span()
+                for category in categories:
+                    concept_mentions[category][token].append(span)
+
+            for category, category_mentions in concept_mentions.items():
                 # Create LegalConcept objects
-                for concept_text, mentions in concept_mentions.items():
+                for concept_text, mentions in category_mentions.items():
+                    count = len(mentions)
                     concept = LegalConcept(
                         concept=concept_text,
                         category=category,
-                        mentions=mentions,
-                        confidence=min(1.0, len(mentions) * 0.2),  # More mentions = higher confidence
+                        starts=np.fromiter((m[0] for m in mentions), dtype=np.int32, count=count),
+                        ends=np.fromiter((m[1] for m in mentions), dtype=np.int32, count=count),
+                        confidence=min(1.0, count * 0.2),  # More mentions = higher confidence
                         related_terms=self._find_related_terms(concept_text, text)
                     )
                     concepts.append(concept)
@@ -402,8 +539,8 @@ class LegalNLPProcessor:
             return []
         
         try:
-            doc = self.nlp(text)
-            concept_token = self.nlp(concept)
+            doc = self._parse(text)
+            concept_token = self._parse(concept)
             
             related_terms = []
             for token in doc:
@@ -431,7 +568,7 @@ class LegalNLPProcessor:
             if not self.nlp:
                 raise AnalysisError("NLP processor not initialized")
             
-            doc = self.nlp(text)
+            doc = self._parse(text)
             
             # Basic sentiment analysis using spaCy
             # Note: This is a simplified approach; for production, consider using
@@ -505,7 +642,7 @@ class LegalNLPProcessor:
             if not self.nlp:
                 raise AnalysisError("NLP processor not initialized")
             
-            doc = self.nlp(text)
+            doc = self._parse(text)
             clauses = []
             
             # Split text into sentences and analyze each
@@ -6,136 +6,503 @@ document requests) into structured legal constructs for analysis.
 """
 
 import re
+import copy
 import json
+import functools
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, fields
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
+# Module-local bind; skips the attribute lookup on every timestamp
+_now = datetime.now
+
+
+@functools.lru_cache(maxsize=None)
+def _framework_for(situation_type: str, primary_jurisdiction: str) -> tuple:
+    """Applicable legal frameworks for a (type, jurisdiction) pair.
+
+    Pure function of two small enumerations, so results are memoized as
+    shared tuples; there are only a few dozen possible keys.
+    """
+    framework_map = {
+        'traffic_stop': ['Constitutional law', 'Administrative law', 'Traffic regulations'],
+        'fee_demand': ['Administrative law', 'Due process', 'Collection procedures'],
+        'court_summons': ['Civil procedure', 'Constitutional law', 'Jurisdictional law'],
+        'contract_dispute': ['Contract law', 'UCC', 'Commercial law'],
+        'administrative_action': ['Administrative law', 'Regulatory compliance', 'Due process'],
+        'property_dispute': ['Property law', 'Real estate law', 'Title law']
+    }
+    
+    frameworks = list(framework_map.get(situation_type, ['General law']))
+    
+    if primary_jurisdiction == 'federal':
+        frameworks.append('Federal law')
+    elif primary_jurisdiction == 'state':
+        frameworks.append('State law')
+    elif primary_jurisdiction == 'local':
+        frameworks.append('Local ordinances')
+    
+    return tuple(frameworks)
+
+
+@functools.lru_cache(maxsize=None)
+def _actions_for(situation_type: str, urgency_level: str) -> tuple:
+    """Suggested actions for a (type, urgency) pair, memoized like
+    _framework_for."""
+    action_map = {
+        'traffic_stop': [
+            'Document the encounter',
+            'Preserve evidence',
+            'Review citation for errors',
+            'Consider challenging jurisdiction'
+        ],
+        'fee_demand': [
+            'Challenge fee authority',
+            'Request fee schedule',
+            'Demand due process hearing',
+            'Preserve payment deadline'
+        ],
+        'court_summons': [
+            'File timely response',
+            'Challenge jurisdiction if applicable',
+            'Demand bill of particulars',
+            'Preserve all rights'
+        ],
+        'contract_dispute': [
+            'Review contract terms',
+            'Document breach if applicable',
+            'Preserve evidence',
+            'Consider mediation'
+        ]
+    }
+    
+    actions = list(action_map.get(situation_type, ['Seek legal counsel', 'Document situation']))
+    
+    if urgency_level == 'high':
+        actions.insert(0, 'URGENT: Immediate action required')
+        actions.append('Consider emergency legal assistance')
+    
+    return tuple(actions)
+
+
+@dataclass(slots=True)
+class Situation:
+    """Structured result of interpreting one real-world input.
+
+    A slotted fixed layout replaces the 13-key dict that was rebuilt per
+    call; subscript access is kept so existing consumers that index into
+    the result keep working.
+    """
+
+    type: str
+    raw_input: str
+    normalized_text: str
+    entities: Dict[str, List[str]]
+    jurisdiction: Dict[str, Any]
+    relationships: List[Dict[str, str]]
+    key_facts: List[str]
+    urgency: Dict[str, Any]
+    timestamp: str
+    context: Dict[str, Any]
+    legal_framework: List[str]
+    potential_issues: List[str]
+    required_actions: List[str]
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain-dict view for callers that need a mapping."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+# pyahocorasick matches every keyword and phrase in one linear scan of the
+# text instead of one substring search per term; fall back to the plain
+# scans when it is not installed. It was preferred over a Hyperscan
+# database for the multi-pattern phases: all the fixed-string tables fit
+# the automaton exactly, while Hyperscan's report-every-match semantics
+# differ from re's leftmost match for the grouped entity patterns and
+# would change extraction output.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# google-re2 scans in guaranteed linear time (no backtracking blowups on
+# pathological inputs); the extraction patterns below use no
+# backreferences or lookaround, so it is a drop-in engine for them.
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# All patterns used on the interpret_situation hot path are compiled once at
+# import; inline string patterns forced a cache lookup (and potential
+# recompile) inside every call.
+_WS_RE = re.compile(r'\s+')
+
+_ABBREV_MAP = {
+    'dept': 'department',
+    'gov': 'government',
+    'admin': 'administrative',
+    'reg': 'regulation',
+    'sec': 'section',
+    'vs': 'versus',
+    'v.': 'versus'
+}
+_ABBREV_RE = re.compile(
+    r'\b(?:' + '|'.join(sorted(map(re.escape, _ABBREV_MAP), key=len, reverse=True)) + r')\b')
+
+
+def _abbrev_repl(match: "re.Match") -> str:
+    return _ABBREV_MAP[match.group(0)]
+
+# Each entity bucket's patterns are fused into one alternation so the text
+# is scanned once per bucket instead of once per pattern. Buckets stay
+# separate regexes on purpose: folding them all into one pass would let a
+# match in one bucket consume characters another bucket needs.
+_PEOPLE_RE = _re_engine.compile(
+    r'\b[A-Z][a-z]+ [A-Z][a-z]+\b'  # First Last
+    r'|\b(?:officer|judge|attorney|mr|ms|mrs)\.?\s+[A-Z][a-z]+\b',
+    re.IGNORECASE)
+
+# The two organization patterns overlap on the keyword itself ("the
+# department" / "department of motor") and both matches are wanted, so
+# they stay separate scans rather than one consuming the other's start.
+_ORG_RES = tuple(_re_engine.compile(p, re.IGNORECASE) for p in (
+    r'\b[A-Z][a-z]*\s+(?:department|agency|bureau|office|court|police)\b',
+    r'\b(?:department|agency|bureau|office|court|police)\s+of\s+[A-Z][a-z]+\b'
+))
+
+_DATE_RE = _re_engine.compile(
+    r'\b\d{1,2}/\d{1,2}/\d{2,4}\b'
+    r'|\b\d{1,2}-\d{1,2}-\d{2,4}\b'
+    r'|\b(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2},?\s+\d{4}\b',
+    re.IGNORECASE)
+
+_AMOUNT_RE = _re_engine.compile(
+    r'\$\d+(?:,\d{3})*(?:\.\d{2})?'
+    r'|\b\d+(?:,\d{3})*(?:\.\d{2})?\s+dollars?\b',
+    re.IGNORECASE)
+
+_ID_RE = _re_engine.compile(
+    r'\b(?:case|citation|ticket|docket)\s*#?\s*[A-Z0-9-]+\b'
+    r'|\b[A-Z]{2,}\d{4,}\b',
+    re.IGNORECASE)
+
+_ENTITY_BUCKETS = (
+    ('people', _PEOPLE_RE),
+    ('dates', _DATE_RE),
+    ('amounts', _AMOUNT_RE),
+    ('identifiers', _ID_RE),
+)
+
+_RELATIONSHIP_RES = tuple(
+    (_re_engine.compile(p, re.IGNORECASE), rtype) for p, rtype in (
+        (r'(\w+)\s+(?:vs?\.?|versus)\s+(\w+)', 'adversarial'),
+        (r'(\w+)\s+(?:and|&)\s+(\w+)', 'joint'),
+        (r'(\w+)\s+(?:represents?|representing)\s+(\w+)', 'representation'),
+        (r'(\w+)\s+(?:sues?|suing)\s+(\w+)', 'litigation'),
+        (r'(\w+)\s+(?:contracts?|contracting)\s+(?:with\s+)?(\w+)', 'contractual')
+    )
+)
+
+_FACT_RES = {
+    'traffic_stop': tuple(_re_engine.compile(p, re.IGNORECASE) for p in (
+        r'(?:speed|speeding).*?(\d+\s*mph)',
+        r'(?:location|where|at).*?([A-Z][a-z]+\s+(?:street|road|avenue|highway))',
+        r'(?:time|when).*?(\d{1,2}:\d{2}(?:\s*[ap]m)?)'
+    )),
+    'fee_demand': tuple(_re_engine.compile(p, re.IGNORECASE) for p in (
+        r'(?:amount|fee|fine).*?(\$\d+(?:,\d{3})*(?:\.\d{2})?)',
+        r'(?:due|deadline).*?(\d{1,2}/\d{1,2}/\d{2,4})',
+        r'(?:account|reference).*?([A-Z0-9-]+)'
+    )),
+    '_default': tuple(_re_engine.compile(p, re.IGNORECASE) for p in (
+        r'(?:date|when).*?(\d{1,2}/\d{1,2}/\d{2,4})',
+        r'(?:amount|cost|fee).*?(\$\d+(?:,\d{3})*(?:\.\d{2})?)',
+        r'(?:location|where|at).*?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'
+    ))
+}
+_FACT_DEFAULT = _FACT_RES['_default']
+
+# Issue keywords fused into one word-bounded alternation; the boundaries
+# also stop e.g. 'notice' from firing inside unrelated words
+_ISSUE_MAP = {
+    'waiver': 'Potential rights waiver',
+    'consent': 'Consent issues',
+    'jurisdiction': 'Jurisdictional questions',
+    'authority': 'Authority challenges',
+    'due process': 'Due process concerns',
+    'notice': 'Notice requirements',
+    'deadline': 'Time-sensitive requirements',
+    'penalty': 'Penalty provisions',
+    'default': 'Default consequences'
+}
+_ISSUE_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, _ISSUE_MAP)) + r')\b')
+
+# Tokenizer for hash-based indicator lookups; keeps dots so tokens like
+# 'u.s.' survive
+_TOKEN_RE = re.compile(r'[a-z.]+')
+
+_TIMELINE_RES = tuple(_re_engine.compile(p, re.IGNORECASE) for p in (
+    r'(?:within|by|before)\s+(\d+\s+(?:days?|weeks?|months?))',
+    r'(?:due|deadline).*?(\d{1,2}/\d{1,2}/\d{2,4})'
+))
+
+_URGENCY_INDICATORS = {
+    'high': ['immediate', 'urgent', 'emergency', 'deadline', 'final notice', 'court date'],
+    'medium': ['soon', 'within', 'by', 'before', 'due'],
+    'low': ['when convenient', 'at your earliest', 'please']
+}
+# 'low' outranks 'medium' deliberately: an explicit low-urgency cue
+# downgrades the medium default unless a high cue is also present,
+# matching the original cascade of level checks
+_URGENCY_PRIORITY = {'high': 2, 'low': 1, 'medium': 0}
+_URGENCY_LEVELS = ('medium', 'low', 'high')
+_URGENCY_CHECKS = tuple(
+    (indicator, _URGENCY_PRIORITY[level])
+    for level, indicators in _URGENCY_INDICATORS.items()
+    for indicator in indicators
+)
+
+# Pattern tables are module-level constants built once at import; every
+# interpreter instance shares them instead of rebuilding ~400 strings of
+# dict per construction.
+_SITUATION_PATTERNS = {
+    'traffic_stop': {
+        'keywords': [
+            'traffic', 'driving', 'vehicle', 'license', 'registration', 
+            'insurance', 'speeding', 'violation', 'citation', 'ticket',
+            'officer', 'police', 'patrol', 'stop', 'pulled over'
+        ],
+        'phrases': [
+            'pulled over', 'traffic stop', 'speeding ticket', 'license and registration',
+            'proof of insurance', 'vehicle inspection', 'moving violation'
+        ],
+        'entities': ['officer', 'department', 'citation_number', 'vehicle', 'location']
+    },
+    'fee_demand': {
+        'keywords': [
+            'fee', 'fine', 'penalty', 'charge', 'payment', 'bill', 'invoice',
+            'assessment', 'tax', 'levy', 'collection', 'demand', 'notice'
+        ],
+        'phrases': [
+            'payment due', 'fee schedule', 'penalty assessment', 'collection notice',
+            'final demand', 'administrative fee', 'processing charge'
+        ],
+        'entities': ['agency', 'amount', 'due_date', 'account_number', 'fee_type']
+    },
+    'court_summons': {
+        'keywords': [
+            'court', 'summons', 'complaint', 'lawsuit', 'litigation', 'hearing',
+            'appearance', 'defendant', 'plaintiff', 'case', 'docket', 'judge'
+        ],
+        'phrases': [
+            'court appearance', 'legal proceeding', 'civil action', 'court order',
+            'summons and complaint', 'hearing date', 'case number'
+        ],
+        'entities': ['court', 'case_number', 'hearing_date', 'plaintiff', 'judge']
+    },
+    'contract_dispute': {
+        'keywords': [
+            'contract', 'agreement', 'breach', 'default', 'terms', 'conditions',
+            'obligation', 'performance', 'consideration', 'party', 'dispute'
+        ],
+        'phrases': [
+            'breach of contract', 'contract dispute', 'terms and conditions',
+            'failure to perform', 'contract violation', 'agreement terms'
+        ],
+        'entities': ['parties', 'contract_date', 'terms', 'breach_type', 'damages']
+    },
+    'administrative_action': {
+        'keywords': [
+            'agency', 'department', 'administrative', 'regulation', 'compliance',
+            'enforcement', 'investigation', 'audit', 'inspection', 'permit'
+        ],
+        'phrases': [
+            'administrative action', 'regulatory compliance', 'agency investigation',
+            'permit application', 'inspection notice', 'compliance order'
+        ],
+        'entities': ['agency', 'regulation', 'permit_number', 'inspector', 'violation']
+    },
+    'property_dispute': {
+        'keywords': [
+            'property', 'real estate', 'land', 'title', 'deed', 'ownership',
+            'boundary', 'easement', 'lien', 'mortgage', 'foreclosure'
+        ],
+        'phrases': [
+            'property dispute', 'title issue', 'boundary dispute', 'property rights',
+            'real estate matter', 'land ownership', 'property claim'
+        ],
+        'entities': ['property_address', 'title_company', 'deed_date', 'owner', 'claimant']
+    }
+}
+
+_LEGAL_ENTITIES = {
+    'government_entities': [
+        'department', 'agency', 'bureau', 'office', 'commission', 'board',
+        'authority', 'administration', 'service', 'division'
+    ],
+    'law_enforcement': [
+        'police', 'officer', 'deputy', 'sheriff', 'trooper', 'patrol',
+        'department', 'force', 'bureau', 'agency'
+    ],
+    'judicial_entities': [
+        'court', 'judge', 'magistrate', 'clerk', 'bailiff', 'tribunal',
+        'justice', 'judicial', 'judiciary'
+    ],
+    'commercial_entities': [
+        'corporation', 'company', 'llc', 'inc', 'ltd', 'partnership',
+        'business', 'enterprise', 'firm', 'organization'
+    ]
+}
+
+_JURISDICTION_INDICATORS = {
+    'federal': [
+        'federal', 'united states', 'u.s.', 'irs', 'fbi', 'dea', 'atf',
+        'customs', 'immigration', 'social security', 'medicare'
+    ],
+    'state': [
+        'state', 'commonwealth', 'dmv', 'department of', 'state police',
+        'state court', 'state agency', 'governor', 'legislature'
+    ],
+    'local': [
+        'city', 'county', 'municipal', 'town', 'village', 'parish',
+        'local', 'mayor', 'council', 'commissioner'
+    ],
+    'commercial': [
+        'commercial', 'business', 'trade', 'commerce', 'ucc', 'contract',
+        'agreement', 'transaction', 'sale', 'purchase'
+    ]
+}
+
+
+@functools.cache
+def _build_term_weights() -> Tuple[Dict[str, tuple], Dict[str, int]]:
+    """term -> ((situation_type, weight), ...) plus per-term weight totals.
+
+    A term can score several types, and a string listed as both keyword
+    and phrase keeps both weights, matching the additive substring
+    scoring. Cached so repeated instantiation shares one table.
+    """
+    term_weights: Dict[str, tuple] = {}
+    for situation_type, patterns in _SITUATION_PATTERNS.items():
+        for keyword in patterns['keywords']:
+            term_weights.setdefault(keyword, ())
+            term_weights[keyword] += ((situation_type, 1),)
+        for phrase in patterns['phrases']:
+            term_weights.setdefault(phrase, ())
+            term_weights[phrase] += ((situation_type, 3),)
+    term_total = {
+        term: sum(weight for _, weight in pairs)
+        for term, pairs in term_weights.items()
+    }
+    return term_weights, term_total
+
+
+@functools.cache
+def _build_fallback_rows() -> tuple:
+    """(type, patterns, best score any later type could reach) rows for
+    the fallback scorer's short-circuit."""
+    names = list(_SITUATION_PATTERNS)
+    type_max = [
+        len(_SITUATION_PATTERNS[name]['keywords']) +
+        3 * len(_SITUATION_PATTERNS[name]['phrases'])
+        for name in names
+    ]
+    rows = []
+    max_after = 0
+    for i in range(len(names) - 1, -1, -1):
+        rows.append((names[i], _SITUATION_PATTERNS[names[i]], max_after))
+        max_after = max(max_after, type_max[i])
+    return tuple(reversed(rows))
+
+
+@functools.cache
+def _build_situation_automaton():
+    """Aho-Corasick automaton over all situation terms, or None when the
+    optional dependency is missing."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term in _build_term_weights()[0]:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+@functools.cache
+def _build_urgency_automaton():
+    """Aho-Corasick automaton over the urgency indicators, or None when
+    the optional dependency is missing."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for indicator, _ in _URGENCY_CHECKS:
+        automaton.add_word(indicator, indicator)
+    automaton.make_automaton()
+    return automaton
+
+
+@functools.cache
+def _build_juris_checks() -> tuple:
+    """Jurisdiction indicators flattened once; single words are matched
+    against a token set (one hash probe) instead of rescanning the text,
+    multi-word phrases keep the substring check."""
+    return tuple(
+        (jurisdiction_type, indicator, ' ' not in indicator)
+        for jurisdiction_type, indicators in _JURISDICTION_INDICATORS.items()
+        for indicator in indicators
+    )
+
+
 class SituationInterpreter:
     """
     Interprets real-world legal situations and converts them into structured data
     for analysis by other VeroBrix modules.
     """
+
+    # Fixed slot layout: instances only hold references to the shared
+    # module-level artifacts plus their own result cache, so skip the
+    # per-instance __dict__
+    __slots__ = (
+        'situation_patterns', 'legal_entities', 'jurisdiction_indicators',
+        '_term_weights', '_term_total', '_fallback_rows',
+        '_situation_automaton', '_juris_checks', '_interpret_cache'
+    )
+
+    # Recently interpreted inputs kept in an LRU cache; repeated
+    # submissions of the same text skip the whole regex pipeline
+    INTERPRET_CACHE_SIZE = 512
+
     
     def __init__(self):
-        self.situation_patterns = self._load_situation_patterns()
-        self.legal_entities = self._load_legal_entities()
-        self.jurisdiction_indicators = self._load_jurisdiction_indicators()
+        self.situation_patterns = _SITUATION_PATTERNS
+        self.legal_entities = _LEGAL_ENTITIES
+        self.jurisdiction_indicators = _JURISDICTION_INDICATORS
+        self._term_weights, self._term_total = _build_term_weights()
+        self._fallback_rows = _build_fallback_rows()
+        self._situation_automaton = _build_situation_automaton()
+        self._juris_checks = _build_juris_checks()
+        self._interpret_cache: "OrderedDict[Any, Situation]" = OrderedDict()
     
     def _load_situation_patterns(self) -> Dict[str, Any]:
         """Load patterns for identifying different types of legal situations."""
-        return {
-            'traffic_stop': {
-                'keywords': [
-                    'traffic', 'driving', 'vehicle', 'license', 'registration', 
-                    'insurance', 'speeding', 'violation', 'citation', 'ticket',
-                    'officer', 'police', 'patrol', 'stop', 'pulled over'
-                ],
-                'phrases': [
-                    'pulled over', 'traffic stop', 'speeding ticket', 'license and registration',
-                    'proof of insurance', 'vehicle inspection', 'moving violation'
-                ],
-                'entities': ['officer', 'department', 'citation_number', 'vehicle', 'location']
-            },
-            'fee_demand': {
-                'keywords': [
-                    'fee', 'fine', 'penalty', 'charge', 'payment', 'bill', 'invoice',
-                    'assessment', 'tax', 'levy', 'collection', 'demand', 'notice'
-                ],
-                'phrases': [
-                    'payment due', 'fee schedule', 'penalty assessment', 'collection notice',
-                    'final demand', 'administrative fee', 'processing charge'
-                ],
-                'entities': ['agency', 'amount', 'due_date', 'account_number', 'fee_type']
-            },
-            'court_summons': {
-                'keywords': [
-                    'court', 'summons', 'complaint', 'lawsuit', 'litigation', 'hearing',
-                    'appearance', 'defendant', 'plaintiff', 'case', 'docket', 'judge'
-                ],
-                'phrases': [
-                    'court appearance', 'legal proceeding', 'civil action', 'court order',
-                    'summons and complaint', 'hearing date', 'case number'
-                ],
-                'entities': ['court', 'case_number', 'hearing_date', 'plaintiff', 'judge']
-            },
-            'contract_dispute': {
-                'keywords': [
-                    'contract', 'agreement', 'breach', 'default', 'terms', 'conditions',
-                    'obligation', 'performance', 'consideration', 'party', 'dispute'
-                ],
-                'phrases': [
-                    'breach of contract', 'contract dispute', 'terms and conditions',
-                    'failure to perform', 'contract violation', 'agreement terms'
-                ],
-                'entities': ['parties', 'contract_date', 'terms', 'breach_type', 'damages']
-            },
-            'administrative_action': {
-                'keywords': [
-                    'agency', 'department', 'administrative', 'regulation', 'compliance',
-                    'enforcement', 'investigation', 'audit', 'inspection', 'permit'
-                ],
-                'phrases': [
-                    'administrative action', 'regulatory compliance', 'agency investigation',
-                    'permit application', 'inspection notice', 'compliance order'
-                ],
-                'entities': ['agency', 'regulation', 'permit_number', 'inspector', 'violation']
-            },
-            'property_dispute': {
-                'keywords': [
-                    'property', 'real estate', 'land', 'title', 'deed', 'ownership',
-                    'boundary', 'easement', 'lien', 'mortgage', 'foreclosure'
-                ],
-                'phrases': [
-                    'property dispute', 'title issue', 'boundary dispute', 'property rights',
-                    'real estate matter', 'land ownership', 'property claim'
-                ],
-                'entities': ['property_address', 'title_company', 'deed_date', 'owner', 'claimant']
-            }
-        }
+        return _SITUATION_PATTERNS
     
     def _load_legal_entities(self) -> Dict[str, List[str]]:
         """Load patterns for identifying legal entities and roles."""
-        return {
-            'government_entities': [
-                'department', 'agency', 'bureau', 'office', 'commission', 'board',
-                'authority', 'administration', 'service', 'division'
-            ],
-            'law_enforcement': [
-                'police', 'officer', 'deputy', 'sheriff', 'trooper', 'patrol',
-                'department', 'force', 'bureau', 'agency'
-            ],
-            'judicial_entities': [
-                'court', 'judge', 'magistrate', 'clerk', 'bailiff', 'tribunal',
-                'justice', 'judicial', 'judiciary'
-            ],
-            'commercial_entities': [
-                'corporation', 'company', 'llc', 'inc', 'ltd', 'partnership',
-                'business', 'enterprise', 'firm', 'organization'
-            ]
-        }
+        return _LEGAL_ENTITIES
     
     def _load_jurisdiction_indicators(self) -> Dict[str, List[str]]:
         """Load indicators for different jurisdictional contexts."""
-        return {
-            'federal': [
-                'federal', 'united states', 'u.s.', 'irs', 'fbi', 'dea', 'atf',
-                'customs', 'immigration', 'social security', 'medicare'
-            ],
-            'state': [
-                'state', 'commonwealth', 'dmv', 'department of', 'state police',
-                'state court', 'state agency', 'governor', 'legislature'
-            ],
-            'local': [
-                'city', 'county', 'municipal', 'town', 'village', 'parish',
-                'local', 'mayor', 'council', 'commissioner'
-            ],
-            'commercial': [
-                'commercial', 'business', 'trade', 'commerce', 'ucc', 'contract',
-                'agreement', 'transaction', 'sale', 'purchase'
-            ]
-        }
+        return _JURISDICTION_INDICATORS
     
-    def interpret_situation(self, input_text: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def interpret_situation(self, input_text: str, context: Optional[Dict[str, Any]] = None) -> Situation:
         """
         Main method to interpret a real-world situation from text input.
         
@@ -148,12 +515,87 @@ class SituationInterpreter:
         """
         # Clean and normalize input
         normalized_text = self._normalize_text(input_text)
+        return self._interpret_normalized(input_text, normalized_text, context, None)
+
+    def interpret_batch(self, inputs: List[str], context: Optional[Dict[str, Any]] = None) -> List[Situation]:
+        """
+        Interpret several situations in one call.
+
+        Args:
+            inputs: Raw texts, one per situation
+            context: Optional additional context shared by all inputs
+
+        Returns:
+            One structured situation analysis per input, in order
+        """
+        normalized = [self._normalize_text(text) for text in inputs]
+
+        # The entity regexes run once over the whole batch joined on a
+        # sentinel character; each match routes back to its source input
+        # by offset. No entity pattern can match the sentinel, so matches
+        # never straddle inputs. The rest of the pipeline is per input,
+        # but its fixed per-call overhead amortizes across the batch.
+        offsets = [0]
+        for text in normalized[:-1]:
+            offsets.append(offsets[-1] + len(text) + 1)
+        joined = '\x1e'.join(normalized)
+
+        batch_entities: List[Dict[str, List[str]]] = [
+            {
+                'people': [],
+                'organizations': [],
+                'locations': [],
+                'dates': [],
+                'amounts': [],
+                'identifiers': [],
+                'legal_instruments': []
+            }
+            for _ in inputs
+        ]
+        scans = list(_ENTITY_BUCKETS) + [('organizations', rx) for rx in _ORG_RES]
+        for bucket, rx in scans:
+            for m in rx.finditer(joined):
+                idx = bisect_right(offsets, m.start()) - 1
+                batch_entities[idx][bucket].append(m.group(0))
+
+        return [
+            self._interpret_normalized(
+                input_text, normalized_text, context,
+                {bucket: list(dict.fromkeys(values))
+                 for bucket, values in entities.items()})
+            for input_text, normalized_text, entities
+            in zip(inputs, normalized, batch_entities)
+        ]
+
+    def _interpret_normalized(self, input_text: str, normalized_text: str,
+                              context: Optional[Dict[str, Any]],
+                              entities: Optional[Dict[str, List[str]]]) -> Situation:
+        """Shared pipeline behind interpret_situation/interpret_batch;
+        entities may be precomputed by the batch scan."""
+        # Cache hit: everything but raw_input, timestamp and context is a
+        # pure function of the normalized text, so return a copy of the
+        # prior analysis with those fields refreshed
+        try:
+            cache_key = (normalized_text,
+                         tuple(sorted(context.items())) if context else None)
+            hash(cache_key)
+        except TypeError:
+            cache_key = None  # unhashable/unsortable context; skip caching
+        
+        if cache_key is not None and cache_key in self._interpret_cache:
+            self._interpret_cache.move_to_end(cache_key)
+            situation = copy.deepcopy(self._interpret_cache[cache_key])
+            situation.raw_input = input_text
+            situation.timestamp = _now().isoformat()
+            situation.context = context or {}
+            return situation
         
         # Identify situation type
         situation_type = self._identify_situation_type(normalized_text)
-        
-        # Extract entities
-        entities = self._extract_entities(normalized_text, situation_type)
+
+        # Extract entities (unless the batch scan already did)
+        if entities is None:
+            entities = self._extract_entities(normalized_text, situation_type)
         
         # Determine jurisdiction
         jurisdiction = self._determine_jurisdiction(normalized_text, entities)
@@ -168,73 +610,96 @@ class SituationInterpreter:
         urgency = self._assess_urgency(normalized_text, entities)
         
         # Build structured situation
-        situation = {
-            'type': situation_type,
-            'raw_input': input_text,
-            'normalized_text': normalized_text,
-            'entities': entities,
-            'jurisdiction': jurisdiction,
-            'relationships': relationships,
-            'key_facts': facts,
-            'urgency': urgency,
-            'timestamp': datetime.now().isoformat(),
-            'context': context or {},
-            'legal_framework': self._determine_legal_framework(situation_type, jurisdiction),
-            'potential_issues': self._identify_potential_issues(normalized_text, situation_type),
-            'required_actions': self._suggest_required_actions(situation_type, urgency)
-        }
+        situation = Situation(
+            type=situation_type,
+            raw_input=input_text,
+            normalized_text=normalized_text,
+            entities=entities,
+            jurisdiction=jurisdiction,
+            relationships=relationships,
+            key_facts=facts,
+            urgency=urgency,
+            timestamp=_now().isoformat(),
+            context=context or {},
+            legal_framework=self._determine_legal_framework(situation_type, jurisdiction),
+            potential_issues=self._identify_potential_issues(normalized_text, situation_type),
+            required_actions=self._suggest_required_actions(situation_type, urgency)
+        )
+        
+        if cache_key is not None:
+            self._interpret_cache[cache_key] = copy.deepcopy(situation)
+            if len(self._interpret_cache) > self.INTERPRET_CACHE_SIZE:
+                self._interpret_cache.popitem(last=False)
         
         return situation
     
     def _normalize_text(self, text: str) -> str:
         """Normalize input text for analysis."""
-        # Convert to lowercase
-        text = text.lower()
+        # Lowercase and collapse whitespace
+        text = _WS_RE.sub(' ', text.lower()).strip()
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        # Standardize common abbreviations
-        abbreviations = {
-            'dept': 'department',
-            'gov': 'government',
-            'admin': 'administrative',
-            'reg': 'regulation',
-            'sec': 'section',
-            'vs': 'versus',
-            'v.': 'versus'
-        }
-        
-        for abbrev, full in abbreviations.items():
-            text = re.sub(r'\b' + abbrev + r'\b', full, text)
-        
-        return text
+        # Standardize common abbreviations in one pass
+        return _ABBREV_RE.sub(_abbrev_repl, text)
     
     def _identify_situation_type(self, text: str) -> str:
         """Identify the type of legal situation from the text."""
-        scores = {}
-        
-        for situation_type, patterns in self.situation_patterns.items():
-            score = 0
-            
-            # Check keywords
-            for keyword in patterns['keywords']:
-                if keyword in text:
-                    score += 1
-            
-            # Check phrases (weighted higher)
-            for phrase in patterns['phrases']:
-                if phrase in text:
-                    score += 3
-            
-            scores[situation_type] = score
-        
+        if self._situation_automaton is not None:
+            scores = dict.fromkeys(self.situation_patterns, 0)
+            # Single automaton pass; the set of terms found equals the set
+            # of terms a per-term substring scan would report
+            found = {term for _, term in self._situation_automaton.iter(text)}
+            # Weight not yet credited to any type; once the leader is
+            # ahead of the runner-up by more than this, no other type can
+            # catch up and scoring can stop early
+            remaining = sum(self._term_total[term] for term in found)
+            best_type, best_score, second_score = 'general', 0, 0
+            for term in found:
+                remaining -= self._term_total[term]
+                for situation_type, weight in self._term_weights[term]:
+                    score = scores[situation_type] + weight
+                    scores[situation_type] = score
+                    if situation_type == best_type:
+                        best_score = score
+                    elif score > best_score:
+                        second_score = best_score
+                        best_type, best_score = situation_type, score
+                    elif score > second_score:
+                        second_score = score
+                if best_score > second_score + remaining:
+                    return best_type
+        else:
+            scores = {}
+            best_type, best_score = 'general', 0
+            for situation_type, patterns, max_after in self._fallback_rows:
+                score = 0
+
+                # Check keywords
+                for keyword in patterns['keywords']:
+                    if keyword in text:
+                        score += 1
+
+                # Check phrases (weighted higher)
+                for phrase in patterns['phrases']:
+                    if phrase in text:
+                        score += 3
+
+                scores[situation_type] = score
+                if score > best_score:
+                    best_type, best_score = situation_type, score
+                # No later type can overtake the leader (ties keep the
+                # earlier type, matching the original max())
+                if best_score >= max_after:
+                    break
+            if best_score > 0:
+                return best_type
+            return 'general'
+
         # Return the situation type with the highest score
         if scores:
             best_match = max(scores.items(), key=lambda x: x[1])
             if best_match[1] > 0:
                 return best_match[0]
-        
+
         return 'general'
     
     def _extract_entities(self, text: str, situation_type: str) -> Dict[str, List[str]]:
@@ -249,58 +714,18 @@ class SituationInterpreter:
             'legal_instruments': []
         }
         
-        # Extract people (basic pattern matching)
-        people_patterns = [
-            r'\b[A-Z][a-z]+ [A-Z][a-z]+\b',  # First Last
-            r'\b(?:officer|judge|attorney|mr|ms|mrs)\.?\s+[A-Z][a-z]+\b'
-        ]
-        
-        for pattern in people_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            entities['people'].extend(matches)
-        
-        # Extract organizations
-        org_patterns = [
-            r'\b[A-Z][a-z]*\s+(?:department|agency|bureau|office|court|police)\b',
-            r'\b(?:department|agency|bureau|office|court|police)\s+of\s+[A-Z][a-z]+\b'
-        ]
-        
-        for pattern in org_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            entities['organizations'].extend(matches)
-        
-        # Extract dates
-        date_patterns = [
-            r'\b\d{1,2}/\d{1,2}/\d{2,4}\b',
-            r'\b\d{1,2}-\d{1,2}-\d{2,4}\b',
-            r'\b(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2},?\s+\d{4}\b'
-        ]
-        
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            entities['dates'].extend(matches)
-        
-        # Extract monetary amounts
-        amount_patterns = [
-            r'\$\d+(?:,\d{3})*(?:\.\d{2})?',
-            r'\b\d+(?:,\d{3})*(?:\.\d{2})?\s+dollars?\b'
-        ]
-        
-        for pattern in amount_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            entities['amounts'].extend(matches)
-        
-        # Extract case numbers, citation numbers, etc.
-        id_patterns = [
-            r'\b(?:case|citation|ticket|docket)\s*#?\s*[A-Z0-9-]+\b',
-            r'\b[A-Z]{2,}\d{4,}\b'
-        ]
-        
-        for pattern in id_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            entities['identifiers'].extend(matches)
-        
-        return entities
+        # One scan per bucket over the fused alternations; finditer feeds
+        # extend() lazily instead of materializing a findall list first
+        for bucket, rx in _ENTITY_BUCKETS:
+            entities[bucket].extend(m.group(0) for m in rx.finditer(text))
+
+        for rx in _ORG_RES:
+            entities['organizations'].extend(m.group(0) for m in rx.finditer(text))
+
+        # Overlapping patterns can report the same entity more than once;
+        # dedupe each bucket preserving first-seen order
+        return {bucket: list(dict.fromkeys(values))
+                for bucket, values in entities.items()}
     
     def _determine_jurisdiction(self, text: str, entities: Dict[str, List[str]]) -> Dict[str, Any]:
         """Determine the applicable jurisdiction(s) for the situation."""
@@ -313,11 +738,23 @@ class SituationInterpreter:
         
         scores = {'federal': 0, 'state': 0, 'local': 0, 'commercial': 0}
         
-        for jurisdiction_type, indicators in self.jurisdiction_indicators.items():
-            for indicator in indicators:
-                if indicator in text:
-                    scores[jurisdiction_type] += 1
-                    jurisdiction['indicators'].append(f"{jurisdiction_type}: {indicator}")
+        # One tokenization pass; each single-word indicator is then a set
+        # membership test rather than an O(len(text)) substring scan. This
+        # also stops e.g. 'state' from matching inside 'statement'.
+        tokens = set(_TOKEN_RE.findall(text))
+        
+        # Collect hits in one pass, then score and format them in bulk
+        # rather than interleaving a scan, a count and an f-string per
+        # indicator
+        hits = [
+            (jurisdiction_type, indicator)
+            for jurisdiction_type, indicator, single_word in self._juris_checks
+            if ((indicator in tokens) if single_word else (indicator in text))
+        ]
+        for jurisdiction_type, _ in hits:
+            scores[jurisdiction_type] += 1
+        jurisdiction['indicators'] = [
+            f"{jurisdiction_type}: {indicator}" for jurisdiction_type, indicator in hits]
         
         # Determine primary jurisdiction
         if scores:
@@ -335,184 +772,69 @@ class SituationInterpreter:
     
     def _identify_relationships(self, text: str, entities: Dict[str, List[str]]) -> List[Dict[str, str]]:
         """Identify legal relationships between entities."""
-        relationships = []
-        
-        # Common relationship patterns
-        relationship_patterns = [
-            (r'(\w+)\s+(?:vs?\.?|versus)\s+(\w+)', 'adversarial'),
-            (r'(\w+)\s+(?:and|&)\s+(\w+)', 'joint'),
-            (r'(\w+)\s+(?:represents?|representing)\s+(\w+)', 'representation'),
-            (r'(\w+)\s+(?:sues?|suing)\s+(\w+)', 'litigation'),
-            (r'(\w+)\s+(?:contracts?|contracting)\s+(?:with\s+)?(\w+)', 'contractual')
+        return [
+            {
+                'type': relationship_type,
+                'entity1': m.group(1),
+                'entity2': m.group(2)
+            }
+            for rx, relationship_type in _RELATIONSHIP_RES
+            for m in rx.finditer(text)
         ]
-        
-        for pattern, relationship_type in relationship_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                relationships.append({
-                    'type': relationship_type,
-                    'entity1': match[0],
-                    'entity2': match[1]
-                })
-        
-        return relationships
     
     def _extract_key_facts(self, text: str, situation_type: str) -> List[str]:
         """Extract key factual elements from the text."""
         facts = []
         
-        # Situation-specific fact extraction
-        if situation_type == 'traffic_stop':
-            fact_patterns = [
-                r'(?:speed|speeding).*?(\d+\s*mph)',
-                r'(?:location|where|at).*?([A-Z][a-z]+\s+(?:street|road|avenue|highway))',
-                r'(?:time|when).*?(\d{1,2}:\d{2}(?:\s*[ap]m)?)'
-            ]
-        elif situation_type == 'fee_demand':
-            fact_patterns = [
-                r'(?:amount|fee|fine).*?(\$\d+(?:,\d{3})*(?:\.\d{2})?)',
-                r'(?:due|deadline).*?(\d{1,2}/\d{1,2}/\d{2,4})',
-                r'(?:account|reference).*?([A-Z0-9-]+)'
-            ]
-        else:
-            fact_patterns = [
-                r'(?:date|when).*?(\d{1,2}/\d{1,2}/\d{2,4})',
-                r'(?:amount|cost|fee).*?(\$\d+(?:,\d{3})*(?:\.\d{2})?)',
-                r'(?:location|where|at).*?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'
-            ]
-        
-        for pattern in fact_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            facts.extend(matches)
+        # Situation-specific fact extraction via precompiled pattern sets
+        for rx in _FACT_RES.get(situation_type, _FACT_DEFAULT):
+            facts.extend(rx.findall(text))
         
         return facts
     
     def _assess_urgency(self, text: str, entities: Dict[str, List[str]]) -> Dict[str, Any]:
         """Assess the urgency level of the situation."""
-        urgency_indicators = {
-            'high': ['immediate', 'urgent', 'emergency', 'deadline', 'final notice', 'court date'],
-            'medium': ['soon', 'within', 'by', 'before', 'due'],
-            'low': ['when convenient', 'at your earliest', 'please']
-        }
-        
+        # One automaton pass when available, else one flattened scan in
+        # table order; the level falls out of a max over hit priorities
+        # instead of the branchy per-level cascade
+        automaton = _build_urgency_automaton()
+        if automaton is not None:
+            found = {indicator for _, indicator in automaton.iter(text)}
+            hits = [(indicator, priority) for indicator, priority in _URGENCY_CHECKS
+                    if indicator in found]
+        else:
+            hits = [(indicator, priority) for indicator, priority in _URGENCY_CHECKS
+                    if indicator in text]
+
         urgency = {
-            'level': 'medium',
-            'indicators': [],
+            'level': _URGENCY_LEVELS[max((priority for _, priority in hits), default=0)],
+            'indicators': [indicator for indicator, _ in hits],
             'timeline': None
         }
-        
-        for level, indicators in urgency_indicators.items():
-            for indicator in indicators:
-                if indicator in text:
-                    urgency['indicators'].append(indicator)
-                    if level == 'high':
-                        urgency['level'] = 'high'
-                    elif level == 'low' and urgency['level'] != 'high':
-                        urgency['level'] = 'low'
-        
+
         # Extract timeline information
-        timeline_patterns = [
-            r'(?:within|by|before)\s+(\d+\s+(?:days?|weeks?|months?))',
-            r'(?:due|deadline).*?(\d{1,2}/\d{1,2}/\d{2,4})'
-        ]
-        
-        for pattern in timeline_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                urgency['timeline'] = matches[0]
+        for rx in _TIMELINE_RES:
+            match = rx.search(text)
+            if match:
+                urgency['timeline'] = match.group(1)
                 break
-        
+
         return urgency
     
     def _determine_legal_framework(self, situation_type: str, jurisdiction: Dict[str, Any]) -> List[str]:
         """Determine applicable legal frameworks."""
-        frameworks = []
-        
-        # Base frameworks by situation type
-        framework_map = {
-            'traffic_stop': ['Constitutional law', 'Administrative law', 'Traffic regulations'],
-            'fee_demand': ['Administrative law', 'Due process', 'Collection procedures'],
-            'court_summons': ['Civil procedure', 'Constitutional law', 'Jurisdictional law'],
-            'contract_dispute': ['Contract law', 'UCC', 'Commercial law'],
-            'administrative_action': ['Administrative law', 'Regulatory compliance', 'Due process'],
-            'property_dispute': ['Property law', 'Real estate law', 'Title law']
-        }
-        
-        frameworks.extend(framework_map.get(situation_type, ['General law']))
-        
-        # Add jurisdiction-specific frameworks
-        if jurisdiction['primary'] == 'federal':
-            frameworks.append('Federal law')
-        elif jurisdiction['primary'] == 'state':
-            frameworks.append('State law')
-        elif jurisdiction['primary'] == 'local':
-            frameworks.append('Local ordinances')
-        
-        return frameworks
+        return list(_framework_for(situation_type, jurisdiction['primary']))
     
     def _identify_potential_issues(self, text: str, situation_type: str) -> List[str]:
         """Identify potential legal issues or red flags."""
-        issues = []
-        
-        # Common issue indicators
-        issue_patterns = [
-            ('waiver', 'Potential rights waiver'),
-            ('consent', 'Consent issues'),
-            ('jurisdiction', 'Jurisdictional questions'),
-            ('authority', 'Authority challenges'),
-            ('due process', 'Due process concerns'),
-            ('notice', 'Notice requirements'),
-            ('deadline', 'Time-sensitive requirements'),
-            ('penalty', 'Penalty provisions'),
-            ('default', 'Default consequences')
-        ]
-        
-        for pattern, issue in issue_patterns:
-            if pattern in text:
-                issues.append(issue)
-        
-        return issues
+        # One linear pass over the fused alternation instead of nine
+        # substring scans; dict.fromkeys dedupes repeated hits in order
+        return [_ISSUE_MAP[keyword]
+                for keyword in dict.fromkeys(_ISSUE_RE.findall(text))]
     
     def _suggest_required_actions(self, situation_type: str, urgency: Dict[str, Any]) -> List[str]:
         """Suggest immediate required actions based on situation type and urgency."""
-        actions = []
-        
-        # Base actions by situation type
-        action_map = {
-            'traffic_stop': [
-                'Document the encounter',
-                'Preserve evidence',
-                'Review citation for errors',
-                'Consider challenging jurisdiction'
-            ],
-            'fee_demand': [
-                'Challenge fee authority',
-                'Request fee schedule',
-                'Demand due process hearing',
-                'Preserve payment deadline'
-            ],
-            'court_summons': [
-                'File timely response',
-                'Challenge jurisdiction if applicable',
-                'Demand bill of particulars',
-                'Preserve all rights'
-            ],
-            'contract_dispute': [
-                'Review contract terms',
-                'Document breach if applicable',
-                'Preserve evidence',
-                'Consider mediation'
-            ]
-        }
-        
-        actions.extend(action_map.get(situation_type, ['Seek legal counsel', 'Document situation']))
-        
-        # Add urgency-based actions
-        if urgency['level'] == 'high':
-            actions.insert(0, 'URGENT: Immediate action required')
-            actions.append('Consider emergency legal assistance')
-        
-        return actions
+        return list(_actions_for(situation_type, urgency['level']))
 
 if __name__ == '__main__':
     # Test the situation interpreter
@@ -526,30 +848,33 @@ if __name__ == '__main__':
         "I received a summons from Superior Court in case #CV-2024-0123. The plaintiff is ABC Corporation claiming I breached our service contract signed last year."
     ]
     
-    print("=== VeroBrix Situation Interpreter Test ===")
-    
+    # Accumulate the report and emit it in one write rather than one
+    # print (stdout lock + flush) per line
+    lines = ["=== VeroBrix Situation Interpreter Test ==="]
+
     for i, scenario in enumerate(test_scenarios, 1):
-        print(f"\n--- Scenario {i} ---")
-        print(f"Input: {scenario}")
-        
+        lines.append(f"\n--- Scenario {i} ---")
+        lines.append(f"Input: {scenario}")
+
         situation = interpreter.interpret_situation(scenario)
-        
-        print(f"Situation Type: {situation['type']}")
-        print(f"Primary Jurisdiction: {situation['jurisdiction']['primary']}")
-        print(f"Urgency Level: {situation['urgency']['level']}")
-        
+
+        lines.append(f"Situation Type: {situation['type']}")
+        lines.append(f"Primary Jurisdiction: {situation['jurisdiction']['primary']}")
+        lines.append(f"Urgency Level: {situation['urgency']['level']}")
+
         if situation['entities']['people']:
-            print(f"People: {', '.join(situation['entities']['people'])}")
-        
+            lines.append(f"People: {', '.join(situation['entities']['people'])}")
+
         if situation['entities']['organizations']:
-            print(f"Organizations: {', '.join(situation['entities']['organizations'])}")
-        
+            lines.append(f"Organizations: {', '.join(situation['entities']['organizations'])}")
+
         if situation['key_facts']:
-            print(f"Key Facts: {', '.join(situation['key_facts'])}")
-        
+            lines.append(f"Key Facts: {', '.join(situation['key_facts'])}")
+
         if situation['potential_issues']:
-            print(f"Potential Issues: {', '.join(situation['potential_issues'])}")
-        
-        print("Required Actions:")
-        for action in situation['required_actions']:
-            print(f"  - {action}")
+            lines.append(f"Potential Issues: {', '.join(situation['potential_issues'])}")
+
+        lines.append("Required Actions:")
+        lines.extend(f"  - {action}" for action in situation['required_actions'])
+
+    print('\n'.join(lines))
@@ -9,19 +9,295 @@ Author: VeroBrix Sovereign Intelligence System
 Created: 2025-01-17
 """
 
+import os
+import io
 import re
 import json
+import heapq
+import bisect
+import functools
+import itertools
+import concurrent.futures
 from typing import Dict, List, Tuple, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from pathlib import Path
 
 from .logger import VeroBrixLogger
 from .exceptions import VeroBrixError
 
+# google-re2 compiles the fused alternations into a DFA that scans in
+# guaranteed linear time — the pattern tables use no backreferences or
+# lookaround, so it is a drop-in engine; fall back to stdlib re when the
+# binding is not installed.
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
 
-@dataclass
+# pyahocorasick powers the literal-anchor prefilter: one linear scan of
+# the text decides which pattern tables can possibly match, so wholly
+# irrelevant tables are never scanned. Without it every table is
+# scanned, as before.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+_ANCHOR_WORD_RE = re.compile(r"[a-z]{3,}")
+_ANCHOR_GROUP_RE = re.compile(r"\((?:\?:)?([^()]*)\)([?*])?")
+_ANCHOR_ALT_RE = re.compile(r"[a-z' ]+")
+
+
+def _pattern_anchors(pattern: str) -> Optional[Tuple[str, ...]]:
+    """Derive literal anchor words for a pattern, conservatively.
+
+    Returns words of which at least one is guaranteed to appear, in
+    lowercase, in any text the pattern matches — either the longest
+    mandatory word outside all groups, or every alternative of the first
+    mandatory all-literal group. Returns None when no safe anchor can be
+    derived; such patterns keep their table permanently active.
+    """
+    # Normalize word-boundary and whitespace escapes to spaces, then
+    # drop optionally-quantified characters ("s?" plurals, "'?")
+    simplified = pattern.replace(r"\b", " ").replace(r"\s+", " ").replace(r"\s", " ")
+    simplified = re.sub(r"[a-z'][?*]", " ", simplified)
+
+    groups = []
+
+    def _strip_group(match):
+        if match.group(2) is None:
+            groups.append(match.group(1))
+        return " "
+
+    outside = _ANCHOR_GROUP_RE.sub(_strip_group, simplified)
+    if "|" in outside:
+        return None  # top-level alternation; no single mandatory word
+
+    words = _ANCHOR_WORD_RE.findall(outside)
+    if words:
+        return (max(words, key=len),)
+
+    # No mandatory word outside groups; fall back to a mandatory group
+    # whose alternatives are all plain literals with usable words
+    for group in groups:
+        alternatives = group.split("|")
+        alternative_words = [_ANCHOR_WORD_RE.findall(alt) for alt in alternatives]
+        if (all(alternative_words)
+                and all(_ANCHOR_ALT_RE.fullmatch(alt) for alt in alternatives)):
+            return tuple(max(ws, key=len) for ws in alternative_words)
+    return None
+
+
+# Hit-frequency ranking produced by scripts/profile_patterns.py; when
+# present, each category's patterns are ordered most-frequent-first in
+# the fused alternations so the engine tries likely matches earliest
+_PATTERN_RANKING_PATH = Path(__file__).resolve().parent.parent / "config" / "pattern_ranking.json"
+
+
+def _load_pattern_ranking() -> Dict[str, Dict[str, int]]:
+    """Load the profiled per-pattern hit counts, or {} when absent."""
+    try:
+        with open(_PATTERN_RANKING_PATH, "r", encoding="utf-8") as handle:
+            ranking = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    return ranking if isinstance(ranking, dict) else {}
+
+
+# A pattern that is just one word between boundaries needs no regex at
+# all; it is scanned with str.find instead
+_LITERAL_PATTERN_RE = re.compile(r"\\b([a-z]+)\\b")
+
+
+def _fuse_table(table: Dict[str, List[str]]) -> Tuple[Any, Tuple, Tuple]:
+    r"""Fuse a {category: [pattern, ...]} table into one alternation.
+
+    Each pattern becomes a uniquely named group, so a single finditer
+    pass over the text replaces one scan per pattern; match.lastindex
+    indexes straight into the returned metadata tuple — no string keys
+    or dict hashing on the per-match path. Capturing groups nested
+    inside a pattern get consecutive group numbers before the next
+    named group, so forward-filling maps them back to their enclosing
+    pattern's record.
+
+    Patterns of the shape \bword\b are pulled out of the alternation
+    entirely and returned as (word, metadata_index) literals for the
+    str.find fast path; their records sit at the tail of the metadata
+    tuple, addressed by negative index. This assumes no table's literal
+    word occurs inside another of its patterns' matches, which holds
+    for the scoring tables.
+    """
+    parts = []
+    named = {}
+    literal_records = []
+    literal_words = []
+    index = 0
+    for category, patterns in table.items():
+        for pattern in patterns:
+            literal = _LITERAL_PATTERN_RE.fullmatch(pattern)
+            if literal:
+                literal_words.append(literal.group(1))
+                literal_records.append((category, pattern))
+                continue
+            name = f"{category}_{index}"
+            parts.append(f"(?P<{name}>{pattern})")
+            named[name] = (category, pattern)
+            index += 1
+    rx = _re_engine.compile("|".join(parts), re.IGNORECASE)
+    slots: List[Any] = [None] * (rx.groups + 1)
+    for name, record in named.items():
+        slots[rx.groupindex[name]] = record
+    for i in range(2, len(slots)):
+        if slots[i] is None:
+            slots[i] = slots[i - 1]
+    count = len(literal_words)
+    literals = tuple(
+        (word, position - count)
+        for position, word in enumerate(literal_words)
+    )
+    return rx, tuple(slots) + tuple(literal_records), literals
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _scan_literals(literals: Tuple, text: str) -> List[Tuple]:
+    """Find whole-word occurrences of literal words via str.find.
+
+    Yields the same (metadata_index, matched_text, span) records as the
+    regex scan, sorted by position so the two streams merge cleanly.
+    """
+    folded = text.lower()
+    length = len(folded)
+    hits = []
+    for word, name in literals:
+        width = len(word)
+        start = folded.find(word)
+        while start >= 0:
+            end = start + width
+            if ((start == 0 or not _is_word_char(folded[start - 1]))
+                    and (end == length or not _is_word_char(folded[end]))):
+                hits.append((name, text[start:end], (start, end)))
+            start = folded.find(word, start + 1)
+    hits.sort(key=lambda hit: hit[2])
+    return hits
+
+
+# Long inputs are cut into chunks scanned in parallel; the overlap must
+# exceed any realistic single match so matches straddling a cut are
+# still found by the preceding chunk. Only worthwhile when the re2
+# engine is active, since it releases the GIL inside its C scan loop.
+_PARALLEL_THRESHOLD = 16384
+_CHUNK_SIZE = 8192
+_CHUNK_OVERLAP = 256
+_SCAN_EXECUTOR = None
+
+
+def _iter_matches(rx, text: str, literals: Tuple = ()):
+    """Yield (group_index, matched_text, span) for rx over text.
+
+    Serial finditer normally; long texts under the re2 engine are split
+    into overlapping chunks scanned on a shared thread pool, with spans
+    mapped back to the full text and overlap duplicates dropped.
+    Literal-word patterns extracted by _fuse_table are scanned with
+    str.find and merged back in span order.
+    """
+    literal_hits = _scan_literals(literals, text) if literals else []
+    if _re_engine is re or len(text) <= _PARALLEL_THRESHOLD:
+        if literal_hits:
+            regex_hits = [(match.lastindex, match.group(), match.span())
+                          for match in rx.finditer(text)]
+            yield from heapq.merge(regex_hits, literal_hits,
+                                   key=lambda hit: hit[2])
+        else:
+            for match in rx.finditer(text):
+                yield match.lastindex, match.group(), match.span()
+        return
+
+    global _SCAN_EXECUTOR
+    if _SCAN_EXECUTOR is None:
+        _SCAN_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 4,
+            thread_name_prefix="sovereignty-scan")
+
+    def scan(start):
+        stop = min(start + _CHUNK_SIZE + _CHUNK_OVERLAP, len(text))
+        return [(match.lastindex, match.group(),
+                 (match.start() + start, match.end() + start))
+                for match in rx.finditer(text[start:stop])]
+
+    seen = set()
+    regex_hits = []
+    for chunk_matches in _SCAN_EXECUTOR.map(
+            scan, range(0, len(text), _CHUNK_SIZE)):
+        for hit in chunk_matches:
+            if hit[2] not in seen:
+                seen.add(hit[2])
+                regex_hits.append(hit)
+    yield from heapq.merge(regex_hits, literal_hits, key=lambda hit: hit[2])
+
+
+# Remedy types that mark a decision as punitive rather than restorative;
+# one IGNORECASE scan replaces a chain of substring checks in score_decision.
+_UNLAWFUL_REMEDY_RE = re.compile(r"punitive|penalty|fine|punishment", re.IGNORECASE)
+
+# Per-category scoring tables, hoisted so the pattern builder can bake
+# them into the per-group metadata
+_SERVILE_SEVERITY = {
+    "submission_language": 0.3,
+    "dependency_language": 0.4,
+    "victim_language": 0.5,
+    "corporate_fiction_acceptance": 0.6
+}
+
+_SOVEREIGN_STRENGTH = {
+    "lawful_standing": 0.4,
+    "authority_challenges": 0.5,
+    "constitutional_assertions": 0.4,
+    "commercial_awareness": 0.3,
+    "remedy_focused": 0.5
+}
+
+# Dispatch tags baked into the fused-alternation metadata: the first
+# element of each record routes a hit to the right output stream
+_OUT_SOVEREIGN = 0
+_OUT_DEPENDENCY = 1
+
+# Per-category improvement suggestions, keyed the same way as the servile
+# table; looked up instead of branching per category
+_CATEGORY_SUGGESTIONS = {
+    "submission_language": "Replace submissive phrases with assertive statements of rights and standing",
+    "dependency_language": "Assert your inherent authority rather than seeking permission",
+    "victim_language": "Focus on lawful remedy and rights rather than personal circumstances",
+    "corporate_fiction_acceptance": "Clarify your standing as a living being, not a corporate fiction"
+}
+
+_SERVILE_SUGGESTIONS = {
+    "submission_language": "Replace submissive language with assertive statements of rights and standing",
+    "dependency_language": "Assert your authority rather than seeking permission",
+    "victim_language": "Focus on lawful remedy rather than personal circumstances",
+    "corporate_fiction_acceptance": "Clarify your standing as a living man/woman, not a legal fiction"
+}
+
+_SOVEREIGN_EXPLANATIONS = {
+    "lawful_standing": "Properly establishes standing as a living being with inherent rights",
+    "authority_challenges": "Appropriately challenges presumed authority and jurisdiction",
+    "constitutional_assertions": "Invokes constitutional protections and guarantees",
+    "commercial_awareness": "Demonstrates understanding of commercial vs. lawful distinctions",
+    "remedy_focused": "Focuses on lawful remedy rather than punishment or penalties"
+}
+
+
+@dataclass(frozen=True, slots=True)
 class SovereigntyMetrics:
-    """Sovereignty scoring metrics for a text or decision."""
+    """Sovereignty scoring metrics for a text or decision.
+
+    Frozen and slotted so that results can be cached and shared between
+    callers at fixed per-instance size; the flag, indicator and
+    suggestion fields are tuples for the same reason. Derived variants
+    are built with dataclasses.replace.
+    """
     
     # Overall scores (0-1 scale)
     overall_score: float
@@ -30,12 +306,12 @@ class SovereigntyMetrics:
     autonomy_score: float
     
     # Detailed analysis
-    servile_flags: List[Dict[str, Any]]
-    sovereign_indicators: List[Dict[str, Any]]
+    servile_flags: Tuple[Dict[str, Any], ...]
+    sovereign_indicators: Tuple[Dict[str, Any], ...]
     remedy_alignment: Dict[str, Any]
     
     # Recommendations
-    improvement_suggestions: List[str]
+    improvement_suggestions: Tuple[str, ...]
     sovereignty_level: str  # "Sovereign", "Transitional", "Servile"
 
 
@@ -47,21 +323,24 @@ class SovereigntyScorer:
     sovereign principles and lawful remedy frameworks.
     """
     
+    # Per-instance state is just these two; the compiled pattern
+    # artifacts live on the class (attached at import time below), so
+    # instances stay slot-sized and construction compiles nothing
+    __slots__ = ("logger", "config")
+    
     def __init__(self, config_manager=None):
         """Initialize the sovereignty scoring system."""
         self.logger = VeroBrixLogger(__name__)
         self.config = config_manager
         
-        # Load scoring patterns and rules
-        self._load_scoring_patterns()
-        
         self.logger.info("Sovereignty scoring system initialized")
     
-    def _load_scoring_patterns(self):
-        """Load sovereignty scoring patterns and rules."""
+    @staticmethod
+    def _build_scoring_patterns() -> Dict[str, Any]:
+        """Compile sovereignty scoring patterns and rules."""
         
         # Servile language patterns (negative indicators)
-        self.servile_patterns = {
+        servile_patterns = {
             "submission_language": [
                 r"\bplease\b.*\b(help|assist|allow|permit)\b",
                 r"\bi\s+(humbly|respectfully)\s+(request|ask|beg)\b",
@@ -97,7 +376,7 @@ class SovereigntyScorer:
         }
         
         # Sovereign language patterns (positive indicators)
-        self.sovereign_patterns = {
+        sovereign_patterns = {
             "lawful_standing": [
                 r"\bi\s+am\s+a\s+(living\s+)?(man|woman)\b",
                 r"\bacting\s+in\s+my\s+private\s+capacity\b",
@@ -140,7 +419,7 @@ class SovereigntyScorer:
         }
         
         # Remedy alignment patterns
-        self.remedy_patterns = {
+        remedy_patterns = {
             "lawful_remedy_indicators": [
                 r"\bspecific\s+performance\b",
                 r"\brestitution\b",
@@ -159,7 +438,7 @@ class SovereigntyScorer:
         }
         
         # Autonomy indicators
-        self.autonomy_patterns = {
+        autonomy_patterns = {
             "self_determination": [
                 r"\bi\s+(choose|elect|decide)\s+to\b",
                 r"\bby\s+my\s+own\s+(choice|decision|will)\b",
@@ -176,47 +455,284 @@ class SovereigntyScorer:
                 r"\bcoercion\s+(is\s+)?present\b"
             ]
         }
+        
+        # Order each category by observed hit frequency when a profiling
+        # run has produced a ranking; ties (and the unprofiled default)
+        # keep the authoring order
+        ranking = _load_pattern_ranking()
+        if ranking:
+            for table in (servile_patterns, sovereign_patterns,
+                          remedy_patterns, autonomy_patterns):
+                for category, patterns in table.items():
+                    counts = ranking.get(category)
+                    if counts:
+                        patterns.sort(
+                            key=lambda pattern: -counts.get(pattern, 0))
+        
+        # Compile everything once; feeding raw strings through the re
+        # module functions on every call costs a cache lookup (and under
+        # cache pressure a recompile) per pattern per scan
+        compile_table = lambda table: {
+            category: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for category, patterns in table.items()
+        }
+        artifacts = {
+            "servile_patterns": compile_table(servile_patterns),
+            "sovereign_patterns": compile_table(sovereign_patterns),
+            "remedy_patterns": compile_table(remedy_patterns),
+            "autonomy_patterns": compile_table(autonomy_patterns)
+        }
+        
+        # Fuse tables that provably cannot produce overlapping matches
+        # into a shared alternation. Only sovereign and dependency
+        # patterns qualify: they share no vocabulary and none spans
+        # free-form text. Every other pairing can overlap — finditer
+        # suppresses matches starting inside an earlier one, so e.g.
+        # servile "please ... help" would swallow a remedy phrase it
+        # spans, and "i do not consent to jurisdiction" is both a
+        # sovereign and an autonomy match. Those tables keep their own
+        # scans. Per-group records carry a dispatch tag plus everything
+        # the scan loop needs, resolved once here rather than through
+        # per-match dict lookups.
+        artifacts["_servile_re"], servile_meta, artifacts["_servile_literals"] = _fuse_table(servile_patterns)
+        artifacts["_servile_meta"] = tuple(
+            record if record is None else
+            (record[0], record[1],
+             _SERVILE_SEVERITY.get(record[0], 0.3),
+             _SERVILE_SUGGESTIONS.get(record[0], "Consider more sovereign language alternatives"))
+            for record in servile_meta
+        )
+        artifacts["_remedy_re"], remedy_meta, artifacts["_remedy_literals"] = _fuse_table(remedy_patterns)
+        # Bake the lawful/unlawful split into a flag so the remedy loop
+        # never compares category strings per match
+        artifacts["_remedy_meta"] = tuple(
+            record if record is None else
+            (record[0], record[1], record[0] == "lawful_remedy_indicators")
+            for record in remedy_meta
+        )
+        artifacts["_assertive_re"], assertive_meta, artifacts["_assertive_literals"] = _fuse_table(
+            {**sovereign_patterns,
+             "dependency_language": servile_patterns["dependency_language"]})
+        artifacts["_assertive_meta"] = tuple(
+            record if record is None else
+            ((_OUT_DEPENDENCY,)
+             if record[0] == "dependency_language" else
+             (_OUT_SOVEREIGN, record[0], record[1],
+              _SOVEREIGN_STRENGTH.get(record[0], 0.3),
+              _SOVEREIGN_EXPLANATIONS.get(record[0], "Demonstrates sovereign awareness and understanding")))
+            for record in assertive_meta
+        )
+        artifacts["_autonomy_re"], artifacts["_autonomy_meta"], artifacts["_autonomy_literals"] = _fuse_table(autonomy_patterns)
+        artifacts["_autonomy_weights"] = tuple(
+            0.0 if record is None else
+            (1.0 if record[0] == "self_determination" else 0.8)
+            for record in artifacts["_autonomy_meta"]
+        )
+        
+        # Literal-anchor prefilter over the four tables; a table whose
+        # every pattern has anchors is skipped entirely when none of its
+        # anchor words occur in the text
+        anchor_tables = {
+            "servile": servile_patterns,
+            "sovereign": sovereign_patterns,
+            "remedy": remedy_patterns,
+            "autonomy": autonomy_patterns
+        }
+        table_names = frozenset(anchor_tables)
+        unskippable = set()
+        anchor_words: Dict[str, set] = {}
+        table_words: Dict[str, dict] = {name: {} for name in anchor_tables}
+        for name, table in anchor_tables.items():
+            for patterns in table.values():
+                for pattern in patterns:
+                    anchors = _pattern_anchors(pattern)
+                    if anchors is None:
+                        unskippable.add(name)
+                    else:
+                        for word in anchors:
+                            anchor_words.setdefault(word, set()).add(name)
+                            table_words[name][word] = None
+        artifacts["_table_names"] = table_names
+        artifacts["_unskippable"] = unskippable
+        # Per-table anchor tuples for the automaton-less fallback: the
+        # native substring operator is fast enough for a few dozen words
+        artifacts["_anchor_lists"] = tuple(
+            (name, tuple(words))
+            for name, words in table_words.items() if name not in unskippable
+        )
+        
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for word, names in anchor_words.items():
+                names -= unskippable  # already always active
+                if names:
+                    automaton.add_word(word, frozenset(names))
+            automaton.make_automaton()
+            artifacts["_prefilter_automaton"] = automaton
+        else:
+            artifacts["_prefilter_automaton"] = None
+        
+        return artifacts
     
-    def score_text(self, text: str, context: str = "general") -> SovereigntyMetrics:
+    def score_text(self, text: str, context: str = "general",
+                   early_exit: bool = False) -> SovereigntyMetrics:
         """
         Score a text for sovereignty alignment.
         
         Args:
             text: Text to analyze
             context: Context type (general, legal_document, correspondence, etc.)
+            early_exit: Skip the autonomy scan (reporting the neutral 0.5)
+                when the language and remedy scores already pin the
+                sovereignty level to "Servile" regardless of its outcome;
+                trades exact component scores for fewer passes over
+                heavily servile text
             
         Returns:
             SovereigntyMetrics: Comprehensive sovereignty scoring
         """
         if not text or not text.strip():
-            return SovereigntyMetrics(
-                overall_score=0.5,
-                language_score=0.5,
-                remedy_score=0.5,
-                autonomy_score=0.5,
-                servile_flags=[],
-                sovereign_indicators=[],
-                remedy_alignment={},
-                improvement_suggestions=["No text provided for analysis"],
-                sovereignty_level="Unknown"
+            return self._neutral_metrics()
+        
+        return self._score_text_cached(text, context, early_exit)
+    
+    @staticmethod
+    def _neutral_metrics() -> SovereigntyMetrics:
+        """Metrics for empty input; built fresh so the remedy dict is
+        never shared between results."""
+        return SovereigntyMetrics(
+            overall_score=0.5,
+            language_score=0.5,
+            remedy_score=0.5,
+            autonomy_score=0.5,
+            servile_flags=(),
+            sovereign_indicators=(),
+            remedy_alignment={},
+            improvement_suggestions=("No text provided for analysis",),
+            sovereignty_level="Unknown"
+        )
+    
+    # Joining on this sentinel keeps matches from straddling batch
+    # entries: '.' never crosses the newlines, and no table pattern can
+    # match the \x1e record separator (it is not \s and appears in no
+    # literal)
+    _BATCH_SEPARATOR = "\n\x1e\n"
+    
+    def score_texts(self, texts: List[str], context: str = "general") -> List[SovereigntyMetrics]:
+        """Score several texts with one sweep per pattern table.
+        
+        The texts are joined on a sentinel and each fused alternation
+        scans the combined string once; hits are routed back to their
+        source text by binary search over the cumulative offsets. For n
+        short texts this costs four passes total instead of four per
+        text, at the price of skipping the per-text result cache.
+        """
+        results: List[Optional[SovereigntyMetrics]] = [
+            self._neutral_metrics() if not text or not text.strip() else None
+            for text in texts
+        ]
+        live = [(index, text) for index, text in enumerate(texts)
+                if results[index] is None]
+        if not live:
+            return results
+        
+        combined = self._BATCH_SEPARATOR.join(text for _, text in live)
+        step = len(self._BATCH_SEPARATOR)
+        offsets = []
+        position = 0
+        for _, text in live:
+            offsets.append(position)
+            position += len(text) + step
+        
+        def route(rx, literals):
+            buckets = [[] for _ in live]
+            for name, matched, span in _iter_matches(rx, combined, literals):
+                slot = bisect.bisect_right(offsets, span[0]) - 1
+                base = offsets[slot]
+                buckets[slot].append(
+                    (name, matched, (span[0] - base, span[1] - base)))
+            return buckets
+        
+        servile_hits = route(self._servile_re, self._servile_literals)
+        remedy_hits = route(self._remedy_re, self._remedy_literals)
+        assertive_hits = route(self._assertive_re, self._assertive_literals)
+        autonomy_hits = route(self._autonomy_re, self._autonomy_literals)
+        
+        for slot, (index, text) in enumerate(live):
+            sovereign_indicators, dependency_count = self._dispatch_assertive_hits(
+                assertive_hits[slot])
+            results[index] = self._assemble_metrics(
+                self._servile_flags_from(servile_hits[slot]),
+                sovereign_indicators,
+                self._remedy_alignment_result(
+                    *self._classify_remedy_hits(remedy_hits[slot])),
+                self._autonomy_score_from(autonomy_hits[slot],
+                                          dependency_count),
+                len(text)
             )
         
-        text_lower = text.lower()
+        return results
+    
+    @functools.lru_cache(maxsize=1024)
+    def _score_text_cached(self, text: str, context: str,
+                           early_exit: bool = False) -> SovereigntyMetrics:
+        """Cached scoring pipeline; repeated texts (retried decisions,
+        duplicated documents) skip every scan."""
+        # One anchor scan decides which tables are worth running at all.
+        # The scans themselves run on the original text — IGNORECASE
+        # already folds case, so the old full lowercased copy fed to
+        # every phase was redundant; matches now keep original casing.
+        # A skipped table would find nothing anyway (the prefilter is
+        # conservative), so each merged pass runs when any of its
+        # constituent tables is active.
+        active = self._active_tables(text)
         
         # Analyze servile language
-        servile_flags = self._detect_servile_language(text_lower)
-        
-        # Analyze sovereign indicators
-        sovereign_indicators = self._detect_sovereign_language(text_lower)
+        servile_flags = (self._detect_servile_language(text)
+                         if "servile" in active else [])
         
         # Analyze remedy alignment
-        remedy_alignment = self._analyze_remedy_alignment(text_lower)
+        remedy_alignment = self._remedy_alignment_result(
+            *self._classify_remedy_hits(
+                _iter_matches(self._remedy_re, text, self._remedy_literals))
+            if "remedy" in active else ([], []))
+        
+        # Sovereign indicators and dependency language share another;
+        # the dependency count feeds the autonomy score below
+        if active & {"sovereign", "autonomy", "servile"}:
+            sovereign_indicators, dependency_count = self._dispatch_assertive_hits(
+                _iter_matches(self._assertive_re, text, self._assertive_literals))
+        else:
+            sovereign_indicators, dependency_count = [], 0
         
-        # Analyze autonomy indicators
-        autonomy_score = self._calculate_autonomy_score(text_lower)
+        # Analyze autonomy indicators. With early_exit, the scan is
+        # also skipped when even a perfect autonomy score could not lift
+        # the overall score out of the Servile band.
+        if not active & {"autonomy", "servile"}:
+            autonomy_score = 0.5
+        elif early_exit and (
+                self._calculate_language_score(
+                    servile_flags, sovereign_indicators, len(text)) * 0.4
+                + remedy_alignment.get("score", 0.5) * 0.3 + 0.3 < 0.5):
+            autonomy_score = 0.5
+        else:
+            autonomy_score = self._autonomy_score_from(
+                _iter_matches(self._autonomy_re, text, self._autonomy_literals),
+                dependency_count)
         
+        return self._assemble_metrics(servile_flags, sovereign_indicators,
+                                      remedy_alignment, autonomy_score,
+                                      len(text))
+    
+    def _assemble_metrics(self, servile_flags: List[Dict[str, Any]],
+                          sovereign_indicators: List[Dict[str, Any]],
+                          remedy_alignment: Dict[str, Any],
+                          autonomy_score: float,
+                          text_length: int) -> SovereigntyMetrics:
+        """Fold per-table analysis results into a metrics object; shared
+        by the single-text and batch scoring paths."""
         # Calculate component scores
-        language_score = self._calculate_language_score(servile_flags, sovereign_indicators, len(text))
+        language_score = self._calculate_language_score(servile_flags, sovereign_indicators, text_length)
         remedy_score = remedy_alignment.get("score", 0.5)
         
         # Calculate overall score
@@ -235,67 +751,110 @@ class SovereigntyScorer:
             language_score=language_score,
             remedy_score=remedy_score,
             autonomy_score=autonomy_score,
-            servile_flags=servile_flags,
-            sovereign_indicators=sovereign_indicators,
+            servile_flags=tuple(servile_flags),
+            sovereign_indicators=tuple(sovereign_indicators),
             remedy_alignment=remedy_alignment,
-            improvement_suggestions=suggestions,
+            improvement_suggestions=tuple(suggestions),
             sovereignty_level=sovereignty_level
         )
     
+    def _active_tables(self, text: str) -> frozenset:
+        """Pattern tables that could possibly match the text, decided by
+        one automaton pass over the literal anchors."""
+        # The anchors are lowercase literals, so case is folded here —
+        # the only place the scoring pipeline still copies the text
+        text = text.lower()
+        active = set(self._unskippable)
+        if self._prefilter_automaton is not None:
+            for _, names in self._prefilter_automaton.iter(text):
+                active.update(names)
+                if len(active) == len(self._table_names):
+                    break
+        else:
+            # No automaton: C-level substring probes over the anchor
+            # words still beat running the fused regexes unconditionally
+            for name, words in self._anchor_lists:
+                if any(word in text for word in words):
+                    active.add(name)
+        return frozenset(active)
+    
     def _detect_servile_language(self, text: str) -> List[Dict[str, Any]]:
         """Detect servile language patterns in text."""
-        flags = []
-        
-        for category, patterns in self.servile_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    flags.append({
-                        "category": category,
-                        "pattern": pattern,
-                        "match": match.group(),
-                        "position": match.span(),
-                        "severity": self._get_servile_severity(category),
-                        "suggestion": self._get_servile_suggestion(category, match.group())
-                    })
-        
-        return flags
+        return self._servile_flags_from(
+            _iter_matches(self._servile_re, text, self._servile_literals))
     
     def _detect_sovereign_language(self, text: str) -> List[Dict[str, Any]]:
         """Detect sovereign language patterns in text."""
-        indicators = []
-        
-        for category, patterns in self.sovereign_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    indicators.append({
-                        "category": category,
-                        "pattern": pattern,
-                        "match": match.group(),
-                        "position": match.span(),
-                        "strength": self._get_sovereign_strength(category),
-                        "explanation": self._get_sovereign_explanation(category, match.group())
-                    })
-        
-        return indicators
+        return self._dispatch_assertive_hits(
+            _iter_matches(self._assertive_re, text, self._assertive_literals))[0]
     
     def _analyze_remedy_alignment(self, text: str) -> Dict[str, Any]:
         """Analyze remedy alignment in text."""
+        return self._remedy_alignment_result(
+            *self._classify_remedy_hits(
+                _iter_matches(self._remedy_re, text, self._remedy_literals)))
+    
+    def _servile_flags_from(self, hits) -> List[Dict[str, Any]]:
+        """Build servile flag records from (group, match, span) hits."""
+        flags = []
+        meta = self._servile_meta
+        
+        for name, matched, span in hits:
+            category, pattern, severity, suggestion = meta[name]
+            flags.append({
+                "category": category,
+                "pattern": pattern,
+                "match": matched,
+                "position": span,
+                "severity": severity,
+                "suggestion": suggestion
+            })
+        
+        return flags
+    
+    def _classify_remedy_hits(self, hits) -> Tuple[List[str], List[str]]:
+        """Split remedy hits into (lawful_matches, unlawful_matches)."""
         lawful_matches = []
         unlawful_matches = []
+        meta = self._remedy_meta
+        
+        for name, matched, _span in hits:
+            if meta[name][2]:
+                lawful_matches.append(matched)
+            else:
+                unlawful_matches.append(matched)
         
-        # Check for lawful remedy indicators
-        for pattern in self.remedy_patterns["lawful_remedy_indicators"]:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            lawful_matches.extend([match.group() for match in matches])
+        return lawful_matches, unlawful_matches
+    
+    def _dispatch_assertive_hits(self, hits) -> Tuple[List[Dict[str, Any]], int]:
+        """Route merged sovereign+dependency hits by their dispatch tag.
         
-        # Check for unlawful remedy indicators
-        for pattern in self.remedy_patterns["unlawful_remedy_indicators"]:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            unlawful_matches.extend([match.group() for match in matches])
+        Returns (sovereign_indicators, dependency_count); the count
+        feeds the autonomy score.
+        """
+        indicators = []
+        dependency_count = 0
+        meta = self._assertive_meta
         
-        # Calculate remedy score
+        for name, matched, span in hits:
+            record = meta[name]
+            if record[0] == _OUT_SOVEREIGN:
+                indicators.append({
+                    "category": record[1],
+                    "pattern": record[2],
+                    "match": matched,
+                    "position": span,
+                    "strength": record[3],
+                    "explanation": record[4]
+                })
+            else:
+                dependency_count += 1
+        
+        return indicators, dependency_count
+    
+    def _remedy_alignment_result(self, lawful_matches: List[str],
+                                 unlawful_matches: List[str]) -> Dict[str, Any]:
+        """Build the remedy alignment result from classified matches."""
         lawful_count = len(lawful_matches)
         unlawful_count = len(unlawful_matches)
         total_count = lawful_count + unlawful_count
@@ -314,21 +873,20 @@ class SovereigntyScorer:
     
     def _calculate_autonomy_score(self, text: str) -> float:
         """Calculate autonomy score based on self-determination indicators."""
-        autonomy_matches = 0
-        dependency_matches = 0
-        
-        # Count autonomy indicators
-        for category, patterns in self.autonomy_patterns.items():
-            for pattern in patterns:
-                matches = len(re.findall(pattern, text, re.IGNORECASE))
-                if category == "self_determination":
-                    autonomy_matches += matches
-                elif category == "non_consent":
-                    autonomy_matches += matches * 0.8  # Slightly lower weight
-        
-        # Count dependency indicators (from servile patterns)
-        for pattern in self.servile_patterns["dependency_language"]:
-            dependency_matches += len(re.findall(pattern, text, re.IGNORECASE))
+        return self._autonomy_score_from(
+            _iter_matches(self._autonomy_re, text, self._autonomy_literals),
+            self._dispatch_assertive_hits(
+                _iter_matches(self._assertive_re, text,
+                              self._assertive_literals))[1])
+    
+    def _autonomy_score_from(self, autonomy_hits, dependency_matches: int) -> float:
+        """Compute the autonomy score from autonomy hits and the
+        dependency-language count."""
+        # Count autonomy indicators; non-consent carries a slightly
+        # lower weight, resolved per group up front
+        weights = self._autonomy_weights
+        autonomy_matches = sum(
+            weights[name] for name, _matched, _span in autonomy_hits)
         
         # Calculate score
         total_matches = autonomy_matches + dependency_matches
@@ -352,45 +910,19 @@ class SovereigntyScorer:
     
     def _get_servile_severity(self, category: str) -> float:
         """Get severity score for servile language category."""
-        severity_map = {
-            "submission_language": 0.3,
-            "dependency_language": 0.4,
-            "victim_language": 0.5,
-            "corporate_fiction_acceptance": 0.6
-        }
-        return severity_map.get(category, 0.3)
+        return _SERVILE_SEVERITY.get(category, 0.3)
     
     def _get_sovereign_strength(self, category: str) -> float:
         """Get strength score for sovereign language category."""
-        strength_map = {
-            "lawful_standing": 0.4,
-            "authority_challenges": 0.5,
-            "constitutional_assertions": 0.4,
-            "commercial_awareness": 0.3,
-            "remedy_focused": 0.5
-        }
-        return strength_map.get(category, 0.3)
+        return _SOVEREIGN_STRENGTH.get(category, 0.3)
     
     def _get_servile_suggestion(self, category: str, match: str) -> str:
         """Get improvement suggestion for servile language."""
-        suggestions = {
-            "submission_language": "Replace submissive language with assertive statements of rights and standing",
-            "dependency_language": "Assert your authority rather than seeking permission",
-            "victim_language": "Focus on lawful remedy rather than personal circumstances",
-            "corporate_fiction_acceptance": "Clarify your standing as a living man/woman, not a legal fiction"
-        }
-        return suggestions.get(category, "Consider more sovereign language alternatives")
+        return _SERVILE_SUGGESTIONS.get(category, "Consider more sovereign language alternatives")
     
     def _get_sovereign_explanation(self, category: str, match: str) -> str:
         """Get explanation for sovereign language indicator."""
-        explanations = {
-            "lawful_standing": "Properly establishes standing as a living being with inherent rights",
-            "authority_challenges": "Appropriately challenges presumed authority and jurisdiction",
-            "constitutional_assertions": "Invokes constitutional protections and guarantees",
-            "commercial_awareness": "Demonstrates understanding of commercial vs. lawful distinctions",
-            "remedy_focused": "Focuses on lawful remedy rather than punishment or penalties"
-        }
-        return explanations.get(category, "Demonstrates sovereign awareness and understanding")
+        return _SOVEREIGN_EXPLANATIONS.get(category, "Demonstrates sovereign awareness and understanding")
     
     def _get_remedy_analysis(self, score: float, lawful_count: int, unlawful_count: int) -> str:
         """Generate remedy alignment analysis."""
@@ -408,18 +940,14 @@ class SovereigntyScorer:
         """Generate specific improvement suggestions."""
         suggestions = []
         
-        # Address servile language
+        # Address servile language; dict.fromkeys dedupes in first-seen
+        # order, so suggestions come out deterministic instead of in
+        # hash order
         if servile_flags:
-            categories = set(flag["category"] for flag in servile_flags)
-            for category in categories:
-                if category == "submission_language":
-                    suggestions.append("Replace submissive phrases with assertive statements of rights and standing")
-                elif category == "dependency_language":
-                    suggestions.append("Assert your inherent authority rather than seeking permission")
-                elif category == "victim_language":
-                    suggestions.append("Focus on lawful remedy and rights rather than personal circumstances")
-                elif category == "corporate_fiction_acceptance":
-                    suggestions.append("Clarify your standing as a living being, not a corporate fiction")
+            for category in dict.fromkeys(flag["category"] for flag in servile_flags):
+                suggestion = _CATEGORY_SUGGESTIONS.get(category)
+                if suggestion:
+                    suggestions.append(suggestion)
         
         # Encourage sovereign language
         if len(sovereign_indicators) < 3:
@@ -468,60 +996,77 @@ class SovereigntyScorer:
         # Score the combined text
         metrics = self.score_text(combined_text, context="decision")
         
-        # Adjust scoring for decision context
+        # Adjust scoring for decision context; build a new metrics object
+        # rather than mutating the (possibly cached and shared) original
         if "remedy_type" in decision_data:
-            remedy_type = decision_data["remedy_type"].lower()
-            if any(unlawful in remedy_type for unlawful in ["punitive", "penalty", "fine", "punishment"]):
-                metrics.remedy_score *= 0.5
-                metrics.overall_score = (metrics.language_score * 0.4 + metrics.remedy_score * 0.3 + metrics.autonomy_score * 0.3)
+            if _UNLAWFUL_REMEDY_RE.search(decision_data["remedy_type"]):
+                remedy_score = metrics.remedy_score * 0.5
+                metrics = replace(
+                    metrics,
+                    remedy_score=remedy_score,
+                    overall_score=(metrics.language_score * 0.4 + remedy_score * 0.3
+                                   + metrics.autonomy_score * 0.3)
+                )
         
         return metrics
     
     def generate_sovereignty_report(self, metrics: SovereigntyMetrics, include_details: bool = True) -> str:
         """Generate a human-readable sovereignty report."""
-        report = []
+        # Write straight into one growable buffer instead of collecting
+        # lines and joining them at the end
+        buf = io.StringIO()
+        write = buf.write
         
         # Header
-        report.append("=" * 50)
-        report.append("VEROBRIX SOVEREIGNTY ANALYSIS REPORT")
-        report.append("=" * 50)
+        write("=" * 50)
+        write("\nVEROBRIX SOVEREIGNTY ANALYSIS REPORT\n")
+        write("=" * 50)
         
         # Overall assessment
-        report.append(f"\nSOVEREIGNTY LEVEL: {metrics.sovereignty_level}")
-        report.append(f"Overall Score: {metrics.overall_score:.2f}/1.00")
-        report.append(f"Language Score: {metrics.language_score:.2f}/1.00")
-        report.append(f"Remedy Score: {metrics.remedy_score:.2f}/1.00")
-        report.append(f"Autonomy Score: {metrics.autonomy_score:.2f}/1.00")
+        write(f"\n\nSOVEREIGNTY LEVEL: {metrics.sovereignty_level}")
+        write(f"\nOverall Score: {metrics.overall_score:.2f}/1.00")
+        write(f"\nLanguage Score: {metrics.language_score:.2f}/1.00")
+        write(f"\nRemedy Score: {metrics.remedy_score:.2f}/1.00")
+        write(f"\nAutonomy Score: {metrics.autonomy_score:.2f}/1.00")
         
         if include_details:
             # Servile language flags
             if metrics.servile_flags:
-                report.append(f"\n⚠️  SERVILE LANGUAGE DETECTED ({len(metrics.servile_flags)} instances):")
-                for flag in metrics.servile_flags[:5]:  # Show top 5
-                    report.append(f"  • {flag['match']} ({flag['category']})")
-                    report.append(f"    Suggestion: {flag['suggestion']}")
+                write(f"\n\n⚠️  SERVILE LANGUAGE DETECTED ({len(metrics.servile_flags)} instances):")
+                for flag in itertools.islice(metrics.servile_flags, 5):  # Show top 5
+                    write(f"\n  • {flag['match']} ({flag['category']})")
+                    write(f"\n    Suggestion: {flag['suggestion']}")
             
             # Sovereign indicators
             if metrics.sovereign_indicators:
-                report.append(f"\n✅ SOVEREIGN LANGUAGE FOUND ({len(metrics.sovereign_indicators)} instances):")
-                for indicator in metrics.sovereign_indicators[:5]:  # Show top 5
-                    report.append(f"  • {indicator['match']} ({indicator['category']})")
-                    report.append(f"    Strength: {indicator['explanation']}")
+                write(f"\n\n✅ SOVEREIGN LANGUAGE FOUND ({len(metrics.sovereign_indicators)} instances):")
+                for indicator in itertools.islice(metrics.sovereign_indicators, 5):  # Show top 5
+                    write(f"\n  • {indicator['match']} ({indicator['category']})")
+                    write(f"\n    Strength: {indicator['explanation']}")
             
             # Remedy analysis
             if metrics.remedy_alignment:
-                report.append(f"\n⚖️  REMEDY ALIGNMENT:")
-                report.append(f"  {metrics.remedy_alignment.get('analysis', 'No remedy analysis available')}")
+                write(f"\n\n⚖️  REMEDY ALIGNMENT:")
+                write(f"\n  {metrics.remedy_alignment.get('analysis', 'No remedy analysis available')}")
         
         # Improvement suggestions
         if metrics.improvement_suggestions:
-            report.append(f"\n💡 IMPROVEMENT SUGGESTIONS:")
+            write(f"\n\n💡 IMPROVEMENT SUGGESTIONS:")
             for i, suggestion in enumerate(metrics.improvement_suggestions, 1):
-                report.append(f"  {i}. {suggestion}")
+                write(f"\n  {i}. {suggestion}")
         
-        report.append("\n" + "=" * 50)
+        write("\n\n" + "=" * 50)
         
-        return "\n".join(report)
+        return buf.getvalue()
+
+
+
+# Compile the scoring tables once at import time and attach them as
+# class attributes; the cost moves out of the first scoring call and
+# every instance shares the same artifacts
+for _attribute, _value in SovereigntyScorer._build_scoring_patterns().items():
+    setattr(SovereigntyScorer, _attribute, _value)
+del _attribute, _value
 
 
 # Global sovereignty scorer instance
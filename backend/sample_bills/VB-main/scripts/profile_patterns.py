@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+VeroBrix Pattern Profiler
+
+Counts how often each sovereignty scoring pattern fires across a text
+corpus and writes the counts to config/pattern_ranking.json. The
+sovereignty scorer reads that file at import time and orders each
+category's fused alternation by hit frequency, so the regex engine
+tries the patterns most likely to match first.
+
+Usage:
+    python scripts/profile_patterns.py [file_or_dir ...]
+
+Defaults to profiling the corpus/ directory when no paths are given.
+"""
+
+import os
+import sys
+import json
+import argparse
+from pathlib import Path
+
+# Add modules to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.sovereignty_scorer import SovereigntyScorer
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+RANKING_PATH = PROJECT_ROOT / "config" / "pattern_ranking.json"
+
+
+def iter_text_files(paths):
+    """Yield text file paths from the given files and directories."""
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            for child in sorted(path.rglob("*")):
+                if child.is_file() and child.suffix in (".txt", ".md"):
+                    yield child
+        elif path.is_file():
+            yield path
+        else:
+            print(f"Warning: skipping missing path {path}", file=sys.stderr)
+
+
+def profile(paths):
+    """Count per-pattern hits over the corpus, grouped by category."""
+    scorer = SovereigntyScorer()
+    tables = {
+        **scorer.servile_patterns,
+        **scorer.sovereign_patterns,
+        **scorer.remedy_patterns,
+        **scorer.autonomy_patterns,
+    }
+    counts = {
+        category: {rx.pattern: 0 for rx in patterns}
+        for category, patterns in tables.items()
+    }
+
+    file_count = 0
+    for file_path in iter_text_files(paths):
+        try:
+            text = file_path.read_text(encoding="utf-8", errors="replace")
+        except OSError as error:
+            print(f"Warning: could not read {file_path}: {error}", file=sys.stderr)
+            continue
+        file_count += 1
+        for category, patterns in tables.items():
+            category_counts = counts[category]
+            for rx in patterns:
+                hits = sum(1 for _ in rx.finditer(text))
+                if hits:
+                    category_counts[rx.pattern] += hits
+
+    return counts, file_count
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Profile sovereignty pattern hit frequencies")
+    parser.add_argument("paths", nargs="*",
+                        default=[str(PROJECT_ROOT / "corpus")],
+                        help="Files or directories to profile "
+                             "(default: corpus/)")
+    parser.add_argument("--output", default=str(RANKING_PATH),
+                        help="Where to write the ranking JSON "
+                             "(default: config/pattern_ranking.json)")
+    args = parser.parse_args()
+
+    counts, file_count = profile(args.paths)
+    if file_count == 0:
+        print("No text files found; ranking not written", file=sys.stderr)
+        return 1
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as handle:
+        json.dump(counts, handle, indent=2)
+
+    total_hits = sum(sum(c.values()) for c in counts.values())
+    print(f"Profiled {file_count} files, {total_hits} pattern hits")
+    print(f"Ranking written to {output_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,13 +3,60 @@ Unit tests for the VeroBrix Configuration Manager.
 """
 
 import pytest
-import tempfile
 import os
-import yaml
-from unittest.mock import patch, mock_open
-
 from modules.config_manager import ConfigManager, ConfigurationError, get_config, is_feature_enabled
 
+# Canonical fixture bodies, pre-serialized: the configs are constants,
+# so there is no reason to re-emit them through yaml.dump at runtime
+VALID_YAML = """\
+analysis:
+  timeout_seconds: 600
+logging:
+  level: DEBUG
+templates:
+  directory: test_templates/
+document_generation:
+  output_directory: test_output/
+"""
+
+OVERRIDE_YAML = """\
+analysis:
+  timeout_seconds: 300
+logging:
+  level: INFO
+  file: logs/test.log
+templates:
+  directory: templates/
+document_generation:
+  output_directory: output/
+"""
+
+INVALID_YAML = "invalid: yaml: content: ["
+
+
+@pytest.fixture(scope="session")
+def valid_config_yaml(tmp_path_factory):
+    """Path to a valid configuration file, materialized once per session."""
+    path = tmp_path_factory.mktemp("cfg") / "valid.yaml"
+    path.write_text(VALID_YAML)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def override_config_yaml(tmp_path_factory):
+    """Path to the base config used by the environment-override test."""
+    path = tmp_path_factory.mktemp("cfg") / "override.yaml"
+    path.write_text(OVERRIDE_YAML)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def invalid_config_yaml(tmp_path_factory):
+    """Path to a syntactically invalid YAML file."""
+    path = tmp_path_factory.mktemp("cfg") / "invalid.yaml"
+    path.write_text(INVALID_YAML)
+    return str(path)
+
 
 class TestConfigManager:
     """Test cases for ConfigManager class."""
@@ -27,34 +74,21 @@ class TestConfigManager:
         config2 = ConfigManager()
         assert config1 is config2
     
-    def test_minimal_config_fallback(self):
+    def test_minimal_config_fallback(self, monkeypatch):
         """Test fallback to minimal configuration when no config file exists."""
-        with patch('os.path.exists', return_value=False):
-            config = ConfigManager()
-            assert config.get('analysis.timeout_seconds') == 300
-            assert config.get('logging.level') == 'INFO'
+        monkeypatch.setattr('modules.config_manager.os.path.exists',
+                            lambda _: False)
+        config = ConfigManager()
+        assert config.get('analysis.timeout_seconds') == 300
+        assert config.get('logging.level') == 'INFO'
     
-    def test_load_valid_config(self):
+    def test_load_valid_config(self, valid_config_yaml):
         """Test loading a valid configuration file."""
-        test_config = {
-            'analysis': {'timeout_seconds': 600},
-            'logging': {'level': 'DEBUG'},
-            'templates': {'directory': 'test_templates/'},
-            'document_generation': {'output_directory': 'test_output/'}
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(test_config, f)
-            config_path = f.name
+        config = ConfigManager()
+        config.load_config(valid_config_yaml)
         
-        try:
-            config = ConfigManager()
-            config.load_config(config_path)
-            
-            assert config.get('analysis.timeout_seconds') == 600
-            assert config.get('logging.level') == 'DEBUG'
-        finally:
-            os.unlink(config_path)
+        assert config.get('analysis.timeout_seconds') == 600
+        assert config.get('logging.level') == 'DEBUG'
     
     def test_load_nonexistent_config(self):
         """Test loading a non-existent configuration file."""
@@ -63,46 +97,22 @@ class TestConfigManager:
         with pytest.raises(ConfigurationError, match="Configuration file not found"):
             config.load_config('/nonexistent/path/config.yaml')
     
-    def test_load_invalid_yaml(self):
+    def test_load_invalid_yaml(self, invalid_config_yaml):
         """Test loading an invalid YAML file."""
-        invalid_yaml = "invalid: yaml: content: ["
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(invalid_yaml)
-            config_path = f.name
-        
-        try:
-            config = ConfigManager()
-            with pytest.raises(ConfigurationError, match="Invalid YAML"):
-                config.load_config(config_path)
-        finally:
-            os.unlink(config_path)
-    
-    def test_environment_overrides(self):
+        config = ConfigManager()
+        with pytest.raises(ConfigurationError, match="Invalid YAML"):
+            config.load_config(invalid_config_yaml)
+    
+    def test_environment_overrides(self, monkeypatch, override_config_yaml):
         """Test environment variable overrides."""
-        test_config = {
-            'analysis': {'timeout_seconds': 300},
-            'logging': {'level': 'INFO', 'file': 'logs/test.log'},
-            'templates': {'directory': 'templates/'},
-            'document_generation': {'output_directory': 'output/'}
-        }
+        monkeypatch.setenv('VEROBRIX_LOG_LEVEL', 'DEBUG')
+        monkeypatch.setenv('VEROBRIX_TIMEOUT', '600')
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(test_config, f)
-            config_path = f.name
+        config = ConfigManager()
+        config.load_config(override_config_yaml)
         
-        try:
-            with patch.dict(os.environ, {
-                'VEROBRIX_LOG_LEVEL': 'DEBUG',
-                'VEROBRIX_TIMEOUT': '600'
-            }):
-                config = ConfigManager()
-                config.load_config(config_path)
-                
-                assert config.get('logging.level') == 'DEBUG'
-                assert config.get('analysis.timeout_seconds') == 600
-        finally:
-            os.unlink(config_path)
+        assert config.get('logging.level') == 'DEBUG'
+        assert config.get('analysis.timeout_seconds') == 600
     
     def test_get_with_dot_notation(self):
         """Test getting configuration values with dot notation."""
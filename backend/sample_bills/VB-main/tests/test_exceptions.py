@@ -53,153 +53,49 @@ class TestVeroBrixError:
         assert error_dict == expected
 
 
+# (exception class, expected error code, constructor kwargs) for every
+# specific exception type; one parametrized test replaces twelve
+# near-identical methods
+SPECIFIC_EXCEPTION_CASES = [
+    (ConfigurationError, "CONFIG_ERROR",
+     {"config_key": "test.key", "config_file": "test.yaml"}),
+    (DocumentProcessingError, "DOC_PROCESSING_ERROR",
+     {"document_path": "/path/to/doc.txt", "processing_stage": "parsing"}),
+    (AnalysisError, "ANALYSIS_ERROR",
+     {"analysis_type": "legal_risk", "input_length": 1000}),
+    (TemplateError, "TEMPLATE_ERROR",
+     {"template_name": "test_template", "missing_variables": ["VAR1", "VAR2"]}),
+    (DatabaseError, "DATABASE_ERROR",
+     {"operation": "INSERT", "table": "legal_documents"}),
+    (ValidationError, "VALIDATION_ERROR",
+     {"field_name": "email", "field_value": "invalid-email"}),
+    (AuthenticationError, "AUTH_ERROR",
+     {"user_id": "user123", "auth_method": "password"}),
+    (AuthorizationError, "AUTHZ_ERROR",
+     {"user_id": "user123", "required_permission": "admin"}),
+    (TimeoutError, "TIMEOUT_ERROR",
+     {"operation": "document_analysis", "timeout_seconds": 300}),
+    (ResourceError, "RESOURCE_ERROR",
+     {"resource_type": "template", "resource_id": "template_123"}),
+    (NetworkError, "NETWORK_ERROR",
+     {"url": "https://api.example.com", "status_code": 404}),
+    (IntegrationError, "INTEGRATION_ERROR",
+     {"service_name": "legal_database", "operation": "search"}),
+]
+
+
 class TestSpecificExceptions:
     """Test cases for specific exception types."""
     
-    def test_configuration_error(self):
-        """Test ConfigurationError with specific parameters."""
-        error = ConfigurationError(
-            "Invalid config",
-            config_key="test.key",
-            config_file="test.yaml"
-        )
-        
-        assert error.error_code == "CONFIG_ERROR"
-        assert error.details["config_key"] == "test.key"
-        assert error.details["config_file"] == "test.yaml"
-    
-    def test_document_processing_error(self):
-        """Test DocumentProcessingError with specific parameters."""
-        error = DocumentProcessingError(
-            "Processing failed",
-            document_path="/path/to/doc.txt",
-            processing_stage="parsing"
-        )
-        
-        assert error.error_code == "DOC_PROCESSING_ERROR"
-        assert error.details["document_path"] == "/path/to/doc.txt"
-        assert error.details["processing_stage"] == "parsing"
-    
-    def test_analysis_error(self):
-        """Test AnalysisError with specific parameters."""
-        error = AnalysisError(
-            "Analysis failed",
-            analysis_type="legal_risk",
-            input_length=1000
-        )
-        
-        assert error.error_code == "ANALYSIS_ERROR"
-        assert error.details["analysis_type"] == "legal_risk"
-        assert error.details["input_length"] == 1000
-    
-    def test_template_error(self):
-        """Test TemplateError with specific parameters."""
-        missing_vars = ["VAR1", "VAR2"]
-        error = TemplateError(
-            "Template processing failed",
-            template_name="test_template",
-            missing_variables=missing_vars
-        )
-        
-        assert error.error_code == "TEMPLATE_ERROR"
-        assert error.details["template_name"] == "test_template"
-        assert error.details["missing_variables"] == missing_vars
-    
-    def test_database_error(self):
-        """Test DatabaseError with specific parameters."""
-        error = DatabaseError(
-            "Database operation failed",
-            operation="INSERT",
-            table="legal_documents"
-        )
-        
-        assert error.error_code == "DATABASE_ERROR"
-        assert error.details["operation"] == "INSERT"
-        assert error.details["table"] == "legal_documents"
-    
-    def test_validation_error(self):
-        """Test ValidationError with specific parameters."""
-        error = ValidationError(
-            "Validation failed",
-            field_name="email",
-            field_value="invalid-email"
-        )
-        
-        assert error.error_code == "VALIDATION_ERROR"
-        assert error.details["field_name"] == "email"
-        assert error.details["field_value"] == "invalid-email"
-    
-    def test_authentication_error(self):
-        """Test AuthenticationError with specific parameters."""
-        error = AuthenticationError(
-            "Authentication failed",
-            user_id="user123",
-            auth_method="password"
-        )
-        
-        assert error.error_code == "AUTH_ERROR"
-        assert error.details["user_id"] == "user123"
-        assert error.details["auth_method"] == "password"
-    
-    def test_authorization_error(self):
-        """Test AuthorizationError with specific parameters."""
-        error = AuthorizationError(
-            "Access denied",
-            user_id="user123",
-            required_permission="admin"
-        )
-        
-        assert error.error_code == "AUTHZ_ERROR"
-        assert error.details["user_id"] == "user123"
-        assert error.details["required_permission"] == "admin"
-    
-    def test_timeout_error(self):
-        """Test TimeoutError with specific parameters."""
-        error = TimeoutError(
-            "Operation timed out",
-            operation="document_analysis",
-            timeout_seconds=300
-        )
-        
-        assert error.error_code == "TIMEOUT_ERROR"
-        assert error.details["operation"] == "document_analysis"
-        assert error.details["timeout_seconds"] == 300
-    
-    def test_resource_error(self):
-        """Test ResourceError with specific parameters."""
-        error = ResourceError(
-            "Resource not found",
-            resource_type="template",
-            resource_id="template_123"
-        )
-        
-        assert error.error_code == "RESOURCE_ERROR"
-        assert error.details["resource_type"] == "template"
-        assert error.details["resource_id"] == "template_123"
-    
-    def test_network_error(self):
-        """Test NetworkError with specific parameters."""
-        error = NetworkError(
-            "Network request failed",
-            url="https://api.example.com",
-            status_code=404
-        )
-        
-        assert error.error_code == "NETWORK_ERROR"
-        assert error.details["url"] == "https://api.example.com"
-        assert error.details["status_code"] == 404
-    
-    def test_integration_error(self):
-        """Test IntegrationError with specific parameters."""
-        error = IntegrationError(
-            "External service failed",
-            service_name="legal_database",
-            operation="search"
-        )
+    @pytest.mark.parametrize("exception_class,error_code,kwargs",
+                             SPECIFIC_EXCEPTION_CASES)
+    def test_specific_exception(self, exception_class, error_code, kwargs):
+        """Test that each exception sets its code and records its kwargs."""
+        error = exception_class("Test error message", **kwargs)
         
-        assert error.error_code == "INTEGRATION_ERROR"
-        assert error.details["service_name"] == "legal_database"
-        assert error.details["operation"] == "search"
+        assert error.error_code == error_code
+        for key, value in kwargs.items():
+            assert error.details[key] == value
 
 
 class TestExceptionMapping:
@@ -136,7 +136,7 @@ class VeroBrixSystem:
                 'raw_text': input_text,
                 'context': situation_context
             },
-            'situation_analysis': situation,
+            'situation_analysis': situation.as_dict(),
             'legal_analysis': {
                 'clauses': clauses,
                 'contradictions': contradictions,